@@ -0,0 +1,152 @@
+r"""Measures the per-item throughput of the cycling and zipping functions of
+listools.iterz, next to reference implementations of the modulo-indexing loops
+they used before being rebuilt on itertools. Run it from the root of the
+repository with:
+
+    python benchmarks/iterz_throughput.py
+
+Each function is consumed for ITEMS items, and the best time out of REPEAT runs
+is reported in nanoseconds per item, for the reference implementation (before)
+and for the current one (after). Both are first checked to yield the same
+items.
+"""
+
+import sys
+import timeit
+from collections import deque
+from itertools import count, islice
+from os.path import abspath, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from listools import iterz  # noqa: E402
+from listools.listutils import list_lcm  # noqa: E402
+
+ITEMS = 200000
+REPEAT = 5
+
+
+def old_inf_cycle(input_iter):
+    for i in count():
+        yield input_iter[i % len(input_iter)]
+
+
+def old_ncycle(input_iter, n):
+    for i in range(n * len(input_iter)):
+        yield input_iter[i % len(input_iter)]
+
+
+def old_cycle_until_index(input_iter, i):
+    for item in input_iter[: i + 1]:
+        yield item
+
+
+def old_zip_cycle(*input_iters):
+    max_length = max([len(input_iter) for input_iter in input_iters])
+    for i in range(max_length):
+        output_list = []
+        for input_iter in input_iters:
+            output_list.append(input_iter[i % len(input_iter)])
+        yield tuple(output_list)
+
+
+def old_zip_inf_cycle(*input_iters):
+    for i in count():
+        output_list = []
+        for input_iter in input_iters:
+            output_list.append(input_iter[i % len(input_iter)])
+        yield tuple(output_list)
+
+
+def old_zip_syzygy(*input_iters):
+    lcm = list_lcm([len(input_iter) for input_iter in input_iters])
+    for i in range(lcm):
+        output_list = []
+        for input_iter in input_iters:
+            output_list.append(input_iter[i % len(input_iter)])
+        yield tuple(output_list)
+
+
+def old_zip_longest(*input_iters, default=None):
+    max_length = max([len(input_iter) for input_iter in input_iters])
+    for i in range(max_length):
+        output_list = []
+        for input_iter in input_iters:
+            if i < len(input_iter):
+                output_list.append(input_iter[i])
+            else:
+                output_list.append(default)
+        yield tuple(output_list)
+
+
+def old_iter_mask(input_iter, mask):
+    for item, mask_value in old_zip_cycle(input_iter, mask):
+        if mask_value:
+            yield item
+
+
+short = list(range(7))
+medium = list(range(100))
+long = list(range(ITEMS))
+mask = [1, 0, 1, 1, 0]
+
+cases = [
+    ('inf_cycle',
+     lambda: islice(old_inf_cycle(medium), ITEMS),
+     lambda: islice(iterz.inf_cycle(medium), ITEMS)),
+    ('ncycle',
+     lambda: old_ncycle(medium, ITEMS // len(medium)),
+     lambda: iterz.ncycle(medium, ITEMS // len(medium))),
+    ('cycle_until_index',
+     lambda: old_cycle_until_index(long, ITEMS - 1),
+     lambda: iterz.cycle_until_index(long, ITEMS - 1)),
+    ('zip_cycle',
+     lambda: old_zip_cycle(short, medium, long),
+     lambda: iterz.zip_cycle(short, medium, long)),
+    ('zip_inf_cycle',
+     lambda: islice(old_zip_inf_cycle(short, medium), ITEMS),
+     lambda: islice(iterz.zip_inf_cycle(short, medium), ITEMS)),
+    ('zip_syzygy',
+     lambda: old_zip_syzygy(short, medium, list(range(286))),
+     lambda: iterz.zip_syzygy(short, medium, list(range(286)))),
+    ('zip_longest',
+     lambda: old_zip_longest(short, medium, long),
+     lambda: iterz.zip_longest(short, medium, long)),
+    ('iter_mask',
+     lambda: old_iter_mask(long, mask),
+     lambda: iterz.iter_mask(long, mask)),
+]
+
+
+def consume(iterator) -> int:
+    r"""Exhausts iterator and returns the number of items it yielded."""
+    counter = deque(enumerate(iterator, 1), maxlen=1)
+    return counter[0][0] if counter else 0
+
+
+def time_per_item(make_iterator, items: int) -> float:
+    r"""Returns the best time out of REPEAT runs, in nanoseconds per item."""
+    best = min(timeit.repeat(lambda: consume(make_iterator()),
+                             number=1,
+                             repeat=REPEAT))
+    return best / items * 1e9
+
+
+def main() -> None:
+    print('{:<20}{:>10}{:>10}{:>10}{:>10}'.format('function', 'items',
+                                                  'before', 'after',
+                                                  'speedup'))
+    for name, make_old, make_new in cases:
+        output = list(make_new())
+        if output != list(make_old()):
+            raise AssertionError('{} does not match its reference '
+                                 'implementation'.format(name))
+        items = len(output)
+        before = time_per_item(make_old, items)
+        after = time_per_item(make_new, items)
+        print('{:<20}{:>10}{:>10.1f}{:>10.1f}{:>9.1f}x'.format(
+            name, items, before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+r"""Optional support for NumPy. NumPy is not a dependency of listools, but when
+it is installed some functions use it as a faster path for inputs which are
+NumPy arrays or regular nested lists of numbers. Without NumPy, everything in
+this module is a no-op and the pure Python implementations are used instead.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Below this number of elements, converting a nested list into an array costs
+# more than what the vectorised operations save.
+MIN_ARRAY_SIZE = 512
+
+
+def is_ndarray(obj) -> bool:
+    r"""Returns True if obj is a NumPy array (and thus NumPy is installed)."""
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+
+def as_flat_array(input_list, float_lists: bool = True):
+    r"""Returns a one dimensional NumPy array with the flattened elements of
+    input_list, or None if NumPy is not installed or if input_list does not
+    qualify for the NumPy path.
+
+    NumPy arrays are raveled, which does not copy them when they are
+    contiguous. Lists qualify when they are rectangular (all sublists at the
+    same depth have the same length), have at least MIN_ARRAY_SIZE elements
+    and all of their elements are of the same type, either int or float, so
+    that converting the array back to Python objects gives the very same
+    elements. NumPy arrays found inside lists are leaves like any other
+    element, so lists containing them never qualify. Lists of floats
+    containing NaN never qualify, since NumPy and Python order NaN
+    differently. Setting float_lists to False makes lists of floats never
+    qualify either, for callers which reduce floats with the built-in
+    functions anyway, so that converting them into an array does not pay off.
+    """
+    if numpy is None:
+        return None
+    if isinstance(input_list, numpy.ndarray):
+        return input_list.ravel()
+    shape = []
+    element = input_list
+    while isinstance(element, list):
+        if len(element) == 0:
+            return None
+        shape.append(len(element))
+        element = element[0]
+    element_type = type(element)
+    if element_type is not int and (element_type is not float
+                                    or not float_lists):
+        return None
+    size = 1
+    for length in shape:
+        size *= length
+    if size < MIN_ARRAY_SIZE:
+        return None
+    rows = [input_list]
+    for length in shape[:-1]:
+        next_rows = []
+        for row in rows:
+            if type(row) is not list or len(row) != length:
+                return None
+            next_rows += row
+        rows = next_rows
+    length = shape[-1]
+    for row in rows:
+        if type(row) is not list or len(row) != length:
+            return None
+        if set(map(type, row)) != {element_type}:
+            return None
+    try:
+        array = numpy.asarray(input_list)
+    except (OverflowError, ValueError):
+        return None
+    if array.dtype.kind not in 'iuf':
+        return None
+    if element_type is float and numpy.isnan(array).any():
+        return None
+    return array.ravel()
+
+
+def sum_array(array, start=0):
+    r"""Sums a one dimensional array returned by as_flat_array(). Arrays of
+    integers are only summed by NumPy when the total cannot overflow. Any
+    other array, including arrays of floats, is summed by the built-in sum()
+    on its elements as Python objects, so that the result is exactly the same
+    as without NumPy.
+    """
+    if array.dtype.kind in 'iu' and array.size > 0:
+        bound = max(abs(array.max().item()), abs(array.min().item()))
+        if bound * array.size < 2 ** 63:
+            return start + array.sum().item()
+    return sum(array.tolist(), start)
+
+
+def min_array(array):
+    r"""Returns the minimum of a non-empty one dimensional array returned by
+    as_flat_array(). Only arrays of integers are reduced by NumPy: for floats,
+    the built-in min() is used, since NumPy may return either of two equal
+    elements such as 0.0 and -0.0.
+    """
+    if array.dtype.kind in 'iu':
+        return array.min().item()
+    return min(array.tolist())
+
+
+def max_array(array):
+    r"""Same as min_array(), for the maximum."""
+    if array.dtype.kind in 'iu':
+        return array.max().item()
+    return max(array.tolist())
+
+
+def sort_array(array, reverse: bool = False) -> list:
+    r"""Sorts a one dimensional array returned by as_flat_array() into a list,
+    stably and in the same order as sorted() would.
+    """
+    if reverse:
+        # sorted(reverse=True) keeps equal elements in their original order,
+        # which is the same as reversing, sorting stably and reversing again.
+        return numpy.sort(array[::-1], kind='stable')[::-1].tolist()
+    return numpy.sort(array, kind='stable').tolist()
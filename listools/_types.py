@@ -0,0 +1,20 @@
+r"""Private helpers for checking the types of the elements of lists, shared by
+the functions of llogic and flatools.
+"""
+
+from itertools import repeat as _repeat
+from operator import is_not as _is_not
+
+
+def count_types(iterable) -> int:
+    r"""Counts the distinct types of the elements of iterable, but stops
+    counting at 2: returns 0 if iterable is empty, 1 if all its elements are of
+    the same type, and 2 as soon as an element of a type different from the
+    first one is found. The comparisons run in C through map().
+    """
+    iterator = iter(iterable)
+    for element in iterator:
+        if any(map(_is_not, map(type, iterator), _repeat(type(element)))):
+            return 2
+        return 1
+    return 0
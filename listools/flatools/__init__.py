@@ -8,17 +8,33 @@ from listools import flatools
 This library is published under the MIT License.
 """
 
+from .flat_shape import FlatShape
+from .flat_view import FlatView
 from .flatten import flatten
 from .flatten_choice import flatten_choice
+from .flatten_chunks import flatten_chunks
+from .flatten_contains import flatten_contains
+from .flatten_enumerate import flatten_enumerate
 from .flatten_index import flatten_index
 from .flatten_join import flatten_join
 from .flatten_len import flatten_len
 from .flatten_max import flatten_max
 from .flatten_min import flatten_min
+from .flatten_minmax import flatten_minmax
 from .flatten_mixed_type import flatten_mixed_type
+from .flatten_nlargest import flatten_nlargest
+from .flatten_nsmallest import flatten_nsmallest
 from .flatten_reverse import flatten_reverse
+from .flatten_plan import FlattenPlan
 from .flatten_single_type import flatten_single_type
 from .flatten_sorted import flatten_sorted
+from .flatten_stats import FlattenStats, flatten_stats
 from .flatten_sum import flatten_sum
+from .flatten_to_array import flatten_to_array
+from .flatten_with_shape import flatten_with_shape
 from .flatten_zip_cycle import flatten_zip_cycle
+from .iflatten import iflatten
+from .iflatten_sorted import iflatten_sorted
+from .ipflatten import ipflatten
 from .pflatten import pflatten
+from .unflatten import unflatten
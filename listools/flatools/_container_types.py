@@ -0,0 +1,57 @@
+r"""Private helpers shared by the flatten functions which take a 'types'
+argument with the container types to be descended into.
+"""
+
+from typing import Tuple
+
+# Strings and bytes are never descended into, even when they are instances of
+# the flatten types (e.g. collections.abc.Sequence), since iterating over a
+# one-character string gives back the same string.
+_ATOMIC_TYPES = (str, bytes, bytearray)
+
+
+def _resolve_types(types) -> Tuple[type, ...]:
+    r"""Returns the tuple of container types to be used by the flatten
+    functions given the value of their 'types' argument.
+    """
+    if types is None:
+        return (list, )
+    if isinstance(types, type):
+        types = (types, )
+    if not isinstance(types, tuple) or len(types) == 0:
+        raise TypeError('\'types\' must be a \'type\' or a non-empty '
+                        '\'tuple\' of \'type\'')
+    return _check_types(types)
+
+
+def _check_types(types: tuple) -> Tuple[type, ...]:
+    if not all(isinstance(container_type, type) for container_type in types):
+        raise TypeError('\'types\' must be a \'type\' or a non-empty '
+                        '\'tuple\' of \'type\'')
+    if any(issubclass(container_type, _ATOMIC_TYPES)
+           for container_type in types):
+        raise ValueError('\'types\' must not contain \'str\', \'bytes\' or '
+                         '\'bytearray\'')
+    return types
+
+
+def _dispatch_table(types: Tuple[type, ...]) -> dict:
+    r"""Returns a dictionary mapping types to whether their instances must be
+    descended into. It starts with the given types, and the flatten loops add
+    every new type they encounter to it, so that isinstance() is called only
+    once per distinct type instead of once per element.
+    """
+    dispatch = dict.fromkeys(types, True)
+    dispatch.update(dict.fromkeys(_ATOMIC_TYPES, False))
+    return dispatch
+
+
+def _is_container(dispatch: dict,
+                  element_type: type,
+                  types: Tuple[type, ...]
+                  ) -> bool:
+    r"""Adds element_type to the dispatch table and returns its entry."""
+    is_container = (issubclass(element_type, types)
+                    and not issubclass(element_type, _ATOMIC_TYPES))
+    dispatch[element_type] = is_container
+    return is_container
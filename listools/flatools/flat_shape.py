@@ -0,0 +1,93 @@
+_OPEN = -1
+_CLOSE = -2
+
+
+class FlatShape:
+    r"""flatools.FlatShape(template)
+
+    Nesting structure of a list containing any number of nested sublists,
+    independently of the values of its elements. It is returned by
+    flatools.flatten_with_shape() and used by flatools.unflatten() to rebuild
+    the nested list from its flattened elements. It can also be created
+    directly from a template list. Usage:
+
+    >>> shape = flatools.FlatShape([1, [2, [3, 4]], [5]])
+    >>> shape.size
+    5
+    >>> shape == flatools.FlatShape(['a', ['b', ['c', 'd']], ['e']])
+    True
+    >>> flatools.unflatten([10, 20, 30, 40, 50], shape)
+    [10, [20, [30, 40]], [50]]
+
+    The structure is stored compactly as a sequence of instructions (runs of
+    consecutive elements, and the starts and ends of sublists), so that a same
+    shape can be reused to rebuild any number of lists without traversing a
+    template again. Shapes are immutable and hashable.
+    """
+
+    __slots__ = ('_codes', 'size')
+
+    def __init__(self, template: list) -> None:
+        if not isinstance(template, list):
+            raise TypeError('\'template\' must be \'list\'')
+        self._codes, self.size = _shape_codes(template, None)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FlatShape):
+            return NotImplemented
+        return self._codes == other._codes
+
+    def __hash__(self) -> int:
+        return hash(self._codes)
+
+    def __repr__(self) -> str:
+        return 'FlatShape(size={!r})'.format(self.size)
+
+
+def _shape_codes(input_list: list, output_list) -> tuple:
+    r"""Traverses input_list once, without recursion, and returns the tuple of
+    instructions describing its structure together with its number of
+    flattened elements. Positive instructions are runs of that many non-list
+    elements, while _OPEN and _CLOSE mark the start and the end of a sublist.
+    If output_list is not None, the flattened elements are also appended to
+    it, one run at a time.
+    """
+    codes = []
+    append = codes.append
+    size = 0
+    stack = []
+    node = input_list
+    iterator = enumerate(input_list)
+    run_start = 0
+    while True:
+        for i, element in iterator:
+            if isinstance(element, list):
+                if i > run_start:
+                    append(i - run_start)
+                    size += i - run_start
+                    if output_list is not None:
+                        output_list += node[run_start:i]
+                append(_OPEN)
+                stack.append((node, iterator, i + 1))
+                node = element
+                iterator = enumerate(element)
+                run_start = 0
+                break
+        else:
+            if len(node) > run_start:
+                append(len(node) - run_start)
+                size += len(node) - run_start
+                if output_list is not None:
+                    output_list += node[run_start:]
+            if not stack:
+                return tuple(codes), size
+            append(_CLOSE)
+            node, iterator, run_start = stack.pop()
+
+
+def _from_codes(codes: tuple, size: int) -> FlatShape:
+    r"""Creates a FlatShape from already computed instructions."""
+    shape = FlatShape.__new__(FlatShape)
+    shape._codes = codes
+    shape.size = size
+    return shape
@@ -0,0 +1,185 @@
+from array import array as _array
+from bisect import bisect_right as _bisect_right
+from collections.abc import Sequence as _Sequence
+from itertools import islice as _islice
+from .iflatten import _iflatten_aux
+
+
+class FlatView(_Sequence):
+    r"""flatools.FlatView(*input_lists)
+
+    Read-only sequence giving random access to the flattened elements of one
+    or more lists containing any number of nested sublists, without building
+    the flattened list. Usage:
+
+    >>> alist = [1, [2, [3, 4]], [5, 6]]
+    >>> flat = flatools.FlatView(alist)
+    >>> len(flat)
+    6
+    >>> flat[3]
+    4
+    >>> flat[-1]
+    6
+    >>> flat[1:4]
+    [2, 3, 4]
+
+    It can be iterated, also in reverse, without copying the input list:
+
+    >>> list(flat)
+    [1, 2, 3, 4, 5, 6]
+    >>> list(reversed(flat))
+    [6, 5, 4, 3, 2, 1]
+
+    Just like flatools.flatten_join(), it can take multiple lists, which are
+    viewed as if they had been flattened and concatenated:
+
+    >>> alist = [[1, 2], [3, 4]]
+    >>> blist = [[[5], 6], 7]
+    >>> flat = flatools.FlatView(alist, blist)
+    >>> flat[4]
+    5
+    >>> len(flat)
+    7
+
+    When created, the view indexes the flat offsets of the sublists of the
+    input lists once. Afterwards, len() takes constant time and indexing takes
+    logarithmic time. Only lists containing sublists are indexed, so lists
+    made only of non-list elements are indexed directly at no memory cost.
+    Because of that index, the input lists must not be modified while the view
+    is in use.
+    """
+
+    __slots__ = ('_root', '_index', '_len')
+
+    def __init__(self, *input_lists: list) -> None:
+        if not all(isinstance(input_list, list) for input_list in input_lists):
+            raise TypeError('\'*input_lists\' must be one or more \'list\'')
+        self._root = input_lists
+        self._index, self._len = _index_sublists(input_lists)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            indices = range(self._len)[i]
+            if len(indices) == 0:
+                return []
+            if indices.step > 0:
+                return list(_islice(self._iter_from(indices.start),
+                                    0,
+                                    indices.stop - indices.start,
+                                    indices.step,
+                                    ))
+            return [self[j] for j in indices]
+        if not isinstance(i, int):
+            raise TypeError('\'FlatView\' indices must be integers or slices')
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError('\'FlatView\' index out of range')
+        node = self._root
+        while True:
+            position, start = self._locate(node, i)
+            if start is None:
+                return node[position]
+            node = node[position]
+            i -= start
+
+    def __iter__(self):
+        return _iflatten_aux(iter(self._root), [])
+
+    def __reversed__(self):
+        stack = []
+        iterator = reversed(self._root)
+        while True:
+            for element in iterator:
+                if isinstance(element, list):
+                    stack.append(iterator)
+                    iterator = reversed(element)
+                    break
+                yield element
+            else:
+                if not stack:
+                    return
+                iterator = stack.pop()
+
+    def _locate(self, node, i: int) -> tuple:
+        r"""Finds which element of node contains the flat index i. Returns its
+        position in node together with the flat offset at which it starts if
+        it is a sublist, or with None if it is the element itself.
+        """
+        entries = self._index.get(id(node))
+        if entries is None:
+            return i, None
+        starts, ends, positions = entries
+        k = _bisect_right(starts, i) - 1
+        if k < 0:
+            return i, None
+        if i < ends[k]:
+            return positions[k], starts[k]
+        return positions[k] + i - ends[k] + 1, None
+
+    def _iter_from(self, i: int):
+        r"""Iterates over the flattened elements starting at flat index i."""
+        if i >= self._len:
+            return iter(())
+        stack = []
+        node = self._root
+        while True:
+            position, start = self._locate(node, i)
+            if start is None:
+                return _iflatten_aux(_islice(node, position, None), stack)
+            stack.append(_islice(node, position + 1, None))
+            node = node[position]
+            i -= start
+
+
+def _index_sublists(root) -> tuple:
+    r"""Traverses the nested lists in root once, without recursion, and
+    returns a dictionary mapping the id of every list containing sublists to
+    three arrays: the flat offsets at which each of its sublists starts and
+    ends, and their positions within it. Also returns the total number of
+    flattened elements. Sublists appearing more than once are only traversed
+    the first time they are found.
+    """
+    index = {}
+    sizes = {}
+    stack = []
+    node = root
+    iterator = enumerate(root)
+    offset = 0
+    entries = None
+    while True:
+        for position, element in iterator:
+            if isinstance(element, list):
+                size = sizes.get(id(element))
+                if size is None:
+                    stack.append((node, iterator, offset, entries, position))
+                    node = element
+                    iterator = enumerate(element)
+                    offset = 0
+                    entries = None
+                    break
+                if entries is None:
+                    entries = (_array('q'), _array('q'), _array('q'))
+                entries[0].append(offset)
+                entries[1].append(offset + size)
+                entries[2].append(position)
+                offset += size
+            else:
+                offset += 1
+        else:
+            sizes[id(node)] = offset
+            if entries is not None:
+                index[id(node)] = entries
+            if not stack:
+                return index, offset
+            size = offset
+            node, iterator, offset, entries, position = stack.pop()
+            if entries is None:
+                entries = (_array('q'), _array('q'), _array('q'))
+            entries[0].append(offset)
+            entries[1].append(offset + size)
+            entries[2].append(position)
+            offset += size
@@ -1,5 +1,13 @@
-def flatten(input_list: list) -> list:
-    r"""flatools.flatten(input_list)
+from .._numpy import is_ndarray as _is_ndarray
+from ._container_types import _dispatch_table, _is_container, _resolve_types
+
+
+def flatten(input_list: list,
+            *,
+            types: tuple = None,
+            memo: bool = False
+            ) -> list:
+    r"""flatools.flatten(input_list, *[, types, memo])
 
     Completely flattens a list containing any number of nested subslists into a
     one dimensional list. It is equivalent to flatools.pflatten() with
@@ -18,16 +26,147 @@ def flatten(input_list: list) -> list:
     >>> alist = [1, [2.2, True], ['foo', [(1, 4), None]], [3+2j, {'a': 1}]]
     >>> flatools.flatten(alist)
     [1, 2.2, True, 'foo', (1, 4), None, 3+2j, {'a': 1}]
+
+    There is no limit to how deeply the sublists can be nested:
+
+    >>> alist = [1]
+    >>> for _ in range(100000):
+    ...     alist = [alist]
+    >>> flatools.flatten(alist)
+    [1]
+
+    If NumPy is installed, the input can also be a NumPy array, which is
+    raveled into a list of its elements (NumPy arrays inside a list are not
+    flattened, as with any other non-list element):
+
+    >>> flatools.flatten(numpy.array([[1, 2], [3, 4]]))
+    [1, 2, 3, 4]
+
+    By default, only lists are flattened. The optional keyword argument 'types'
+    takes a type or a tuple of types of containers to be flattened instead, so
+    that other containers do not need to be converted into lists beforehand:
+
+    >>> alist = [1, (2, 3), [4, (5, [6])]]
+    >>> flatools.flatten(alist, types=(list, tuple))
+    [1, 2, 3, 4, 5, 6]
+
+    >>> from collections import deque
+    >>> adeque = deque([1, deque([2, 3]), (4, 5)])
+    >>> flatools.flatten(adeque, types=deque)
+    [1, 2, 3, (4, 5)]
+
+    Strings and bytes are never flattened.
+
+    When a same sublist object appears many times in the input (for instance
+    after merging nested lists sharing parts of their structure), setting the
+    optional keyword argument 'memo' to True makes each distinct sublist be
+    traversed only once. On later visits, its already flattened elements are
+    copied from the output list at C speed:
+
+    >>> shared = [[1, 2], [3, [4]]]
+    >>> alist = [shared, [0, shared], shared]
+    >>> flatools.flatten(alist, memo=True)
+    [1, 2, 3, 4, 0, 1, 2, 3, 4, 1, 2, 3, 4]
+
+    The result is the same as without memo, but the time spent traversing the
+    input is proportional to the number of distinct sublists and not to the
+    size of the flattened list.
     """
-    if not isinstance(input_list, list):
+    if not isinstance(memo, bool):
+        raise TypeError('\'memo\' must be \'bool\'')
+    types = _resolve_types(types)
+    if types != (list, ):
+        if not isinstance(input_list, types):
+            raise TypeError('\'input_list\' must be an instance of \'types\'')
+        if memo:
+            return _flatten_memo_aux(input_list, [], types)
+        return _flatten_types_aux(input_list, [], types)
+    if not isinstance(input_list, list) and not _is_ndarray(input_list):
         raise TypeError('\'input_list\' must be \'list\'')
-    def _flatten_aux(input_list, aux_list=None):
-        if aux_list is None:
-            aux_list = []
-        for element in input_list:
+    if _is_ndarray(input_list):
+        return input_list.ravel().tolist()
+    if memo:
+        return _flatten_memo_aux(input_list, [], types)
+    return _flatten_aux(input_list, [])
+
+
+def _flatten_aux(input_list: list, output_list: list) -> list:
+    r"""Appends all elements of input_list and of its nested sublists to
+    output_list. Instead of recursing into each sublist, the iterators of the
+    lists being traversed are kept in an explicit stack, so there is no limit
+    to the nesting depth of input_list.
+    """
+    append = output_list.append
+    stack = []
+    iterator = iter(input_list)
+    while True:
+        for element in iterator:
             if isinstance(element, list):
-                _flatten_aux(element, aux_list)
-            else:
-                aux_list.append(element)
-        return aux_list
-    return _flatten_aux(input_list, aux_list=None)
+                stack.append(iterator)
+                iterator = iter(element)
+                break
+            append(element)
+        else:
+            if not stack:
+                return output_list
+            iterator = stack.pop()
+
+
+def _flatten_types_aux(input_list, output_list: list, types: tuple) -> list:
+    r"""Same as _flatten_aux(), but descending into instances of any of the
+    given container types. Whether an element is a container is looked up by
+    its exact type in a dispatch table, which is filled on the fly.
+    """
+    append = output_list.append
+    dispatch = _dispatch_table(types)
+    stack = []
+    iterator = iter(input_list)
+    while True:
+        for element in iterator:
+            is_container = dispatch.get(type(element))
+            if is_container is None:
+                is_container = _is_container(dispatch, type(element), types)
+            if is_container:
+                stack.append(iterator)
+                iterator = iter(element)
+                break
+            append(element)
+        else:
+            if not stack:
+                return output_list
+            iterator = stack.pop()
+
+
+def _flatten_memo_aux(input_list, output_list: list, types: tuple) -> list:
+    r"""Same as _flatten_types_aux(), but remembering the span of output_list
+    filled by each container, keyed by its id. Containers found again are
+    not traversed; their span is copied to the end of output_list instead.
+    """
+    append = output_list.append
+    dispatch = _dispatch_table(types)
+    spans = {}
+    stack = []
+    node = input_list
+    iterator = iter(input_list)
+    start = 0
+    while True:
+        for element in iterator:
+            is_container = dispatch.get(type(element))
+            if is_container is None:
+                is_container = _is_container(dispatch, type(element), types)
+            if is_container:
+                span = spans.get(id(element))
+                if span is not None:
+                    output_list += output_list[span[0]:span[1]]
+                    continue
+                stack.append((node, iterator, start))
+                node = element
+                iterator = iter(element)
+                start = len(output_list)
+                break
+            append(element)
+        else:
+            if not stack:
+                return output_list
+            spans[id(node)] = (start, len(output_list))
+            node, iterator, start = stack.pop()
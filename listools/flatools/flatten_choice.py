@@ -1,10 +1,20 @@
-from .flatten import flatten
-from random import choice as _choice
+from .flat_view import FlatView
+from .flatten_len import flatten_len
+from .iflatten import iflatten
+from itertools import islice as _islice
+from random import Random
+from random import randrange as _randrange
+from random import sample as _sample
 from typing import Any
 
 
-def flatten_choice(input_list: list) -> Any:
-    r"""flatools.flatten_choice(input_list)
+def flatten_choice(input_list: list,
+                   k: int = None,
+                   *,
+                   replace: bool = True,
+                   rng: Random = None
+                   ) -> Any:
+    r"""flatools.flatten_choice(input_list[, k, *, replace, rng])
 
     Randomly selects an element from a flattened list which can containing any
     number of nested subslists. Usage:
@@ -22,7 +32,70 @@ def flatten_choice(input_list: list) -> Any:
     >>> alist = [1, [2.2, True], ['foo', [(1, 4), None]], [3+2j, {'a': 1}]]
     >>> flatools.flatten_choice(alist)
     (1, 4)
+
+    The list is never flattened: the elements are counted and the chosen one
+    is then reached by traversing the list up to it.
+
+    When the optional argument 'k' is given, a list of k elements is selected
+    instead. By default they are selected with replacement, so the same
+    element can be selected more than once. Setting 'replace' to False selects
+    k distinct elements (that is, elements at distinct positions of the
+    flattened list):
+
+    >>> alist = [[1, 4], [5, 7], [2], [9, 6, 10], [8, 3]]
+    >>> flatools.flatten_choice(alist, 4)
+    [6, 2, 6, 10]
+    >>> flatools.flatten_choice(alist, 4, replace=False)
+    [7, 3, 1, 8]
+
+    Selecting k elements builds a flatools.FlatView of the list, which finds
+    each selected element by descending the sublists according to their
+    sizes. The input can also be a flatools.FlatView, so that its index can be
+    reused when sampling the same list many times:
+
+    >>> flat = flatools.FlatView(alist)
+    >>> flatools.flatten_choice(flat, 3)
+    [10, 1, 5]
+
+    Finally, the optional argument 'rng' takes an instance of random.Random
+    to be used instead of the global random number generator of the module
+    random, which is useful for reproducible sampling:
+
+    >>> rng = random.Random(42)
+    >>> flatools.flatten_choice(alist, 3, rng=rng)
+    [4, 1, 2]
     """
-    if not isinstance(input_list, list):
-        raise TypeError('\'input_list\' must be \'list\'')
-    return _choice(flatten(input_list))
+    if not isinstance(input_list, (list, FlatView)):
+        raise TypeError('\'input_list\' must be \'list\' or \'FlatView\'')
+    if k is not None:
+        if not isinstance(k, int):
+            raise TypeError('\'k\' must be \'int\'')
+        if k < 0:
+            raise ValueError('\'k\' must be >= 0')
+    if not isinstance(replace, bool):
+        raise TypeError('\'replace\' must be \'bool\'')
+    if rng is not None and not isinstance(rng, Random):
+        raise TypeError('\'rng\' must be \'random.Random\'')
+    randrange = _randrange if rng is None else rng.randrange
+    if k is None:
+        if isinstance(input_list, FlatView):
+            length = len(input_list)
+        else:
+            length = flatten_len(input_list)
+        if length == 0:
+            raise IndexError('Cannot choose from an empty sequence')
+        i = randrange(length)
+        if isinstance(input_list, FlatView):
+            return input_list[i]
+        return next(_islice(iflatten(input_list), i, None))
+    if isinstance(input_list, FlatView):
+        flat = input_list
+    else:
+        flat = FlatView(input_list)
+    if not replace:
+        sample = _sample if rng is None else rng.sample
+        return sample(flat, k)
+    length = len(flat)
+    if length == 0 and k > 0:
+        raise IndexError('Cannot choose from an empty sequence')
+    return [flat[randrange(length)] for _ in range(k)]
@@ -0,0 +1,54 @@
+from array import array as _array
+from array import typecodes as _typecodes
+from .iflatten import _iflatten_runs
+
+
+def flatten_chunks(input_list: list, size: int, *, typecode: str = None):
+    r"""flatools.flatten_chunks(input_list, size, *[, typecode])
+
+    Generator which yields the flattened elements of a list containing any
+    number of nested sublists in consecutive lists of 'size' elements (the
+    last one may be shorter). Usage:
+
+    >>> alist = [1, [2, [3, 4]], [5, 6, [7]]]
+    >>> for chunk in flatools.flatten_chunks(alist, 3):
+    ...     print(chunk)
+    [1, 2, 3]
+    [4, 5, 6]
+    [7]
+
+    The chunks are filled while the list is being traversed, so that the
+    flattened list is never built as a whole and each chunk can be processed
+    (e.g. written in bulk) as soon as it is complete. Elements are copied one
+    run of consecutive non-list elements at a time.
+
+    The optional keyword argument 'typecode' makes each chunk an array.array
+    of that typecode instead of a list, as in flatools.flatten_to_array():
+
+    >>> list(flatools.flatten_chunks([[1.5, 2.0], [3.0]], 2, typecode='d'))
+    [array('d', [1.5, 2.0]), array('d', [3.0])]
+    """
+    if not isinstance(input_list, list):
+        raise TypeError('\'input_list\' must be \'list\'')
+    if not isinstance(size, int):
+        raise TypeError('\'size\' must be \'int\'')
+    if size < 1:
+        raise ValueError('\'size\' must be a positive \'int\'')
+    if typecode is not None:
+        if not isinstance(typecode, str):
+            raise TypeError('\'typecode\' must be \'str\'')
+        if typecode not in _typecodes:
+            raise ValueError('\'typecode\' must be one of {!r}'.format(
+                _typecodes))
+    chunk = []
+    for run in _iflatten_runs(input_list):
+        position = 0
+        while position < len(run):
+            stop = position + size - len(chunk)
+            chunk += run[position:stop]
+            position = stop
+            if len(chunk) == size:
+                yield chunk if typecode is None else _array(typecode, chunk)
+                chunk = []
+    if chunk:
+        yield chunk if typecode is None else _array(typecode, chunk)
@@ -0,0 +1,27 @@
+from .iflatten import iflatten
+
+
+def flatten_contains(element, input_list: list) -> bool:
+    r"""flatools.flatten_contains(element, input_list)
+
+    Returns True if an element is found in a list containing any number of
+    nested sublists and False if it is not. Usage:
+
+    >>> alist = [[1, 2], [3, 4], [5, 6]]
+    >>> flatools.flatten_contains(3, alist)
+    True
+    >>> flatools.flatten_contains(7, alist)
+    False
+
+    >>> alist = [1, [2.2, True], ['foo', [(1, 4), None]], [3+2j, {'a': 1}]]
+    >>> flatools.flatten_contains(None, alist)
+    True
+
+    The search stops at the first match, so the rest of the list is never
+    traversed.
+    """
+    if isinstance(element, list):
+        raise TypeError('\'element\' must not be \'list\'')
+    if not isinstance(input_list, list):
+        raise TypeError('\'input_list\' must be \'list\'')
+    return element in iflatten(input_list)
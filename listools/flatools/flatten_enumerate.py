@@ -0,0 +1,62 @@
+def flatten_enumerate(input_list: list, max_depth: int = None):
+    r"""flatools.flatten_enumerate(input_list[, max_depth])
+
+    Generator which yields the elements of a list containing any number of
+    nested sublists in flatten order, each of them in a tuple together with
+    the path of indices leading to it in the nested list. Usage:
+
+    >>> alist = [1, [2, [3, 4]], [5]]
+    >>> for path, value in flatools.flatten_enumerate(alist):
+    ...     print(path, value)
+    (0,) 1
+    (1, 0) 2
+    (1, 1, 0) 3
+    (1, 1, 1) 4
+    (2, 0) 5
+
+    The paths can be used to find and modify elements in place:
+
+    >>> for path, value in flatools.flatten_enumerate(alist):
+    ...     if value == 4:
+    ...         alist[path[0]][path[1]][path[2]] = 40
+    >>> alist
+    [1, [2, [3, 40]], [5]]
+
+    The optional argument 'max_depth' limits the length of the paths, in which
+    case sublists found at that depth are yielded as they are, without being
+    traversed:
+
+    >>> alist = [1, [2, [3, 4]], [5]]
+    >>> list(flatools.flatten_enumerate(alist, max_depth=2))
+    [((0,), 1), ((1, 0), 2), ((1, 1), [3, 4]), ((2, 0), 5)]
+
+    The path of each list being traversed is only built once, when entering
+    it, and kept on the stack as the prefix of the paths of its elements. The
+    path of each element is a new tuple made of that prefix and the index of
+    the element, so its cost grows with the depth of the element.
+    """
+    if not isinstance(input_list, list):
+        raise TypeError('\'input_list\' must be \'list\'')
+    if max_depth is None:
+        last_level = -1
+    elif not isinstance(max_depth, int):
+        raise TypeError('\'max_depth\' must be \'int\'')
+    elif max_depth < 1:
+        raise ValueError('\'max_depth\' must be a positive \'int\'')
+    else:
+        last_level = max_depth - 1
+    stack = []
+    prefix = ()
+    iterator = enumerate(input_list)
+    while True:
+        for i, element in iterator:
+            if isinstance(element, list) and len(stack) != last_level:
+                stack.append((prefix, iterator))
+                prefix += (i, )
+                iterator = enumerate(element)
+                break
+            yield prefix + (i, ), element
+        else:
+            if not stack:
+                return
+            prefix, iterator = stack.pop()
@@ -1,8 +1,13 @@
-from .flatten import flatten
+from .iflatten import iflatten
+from typing import Tuple, Union
 
 
-def flatten_index(element, input_list: list) -> int:
-    r"""flatools.flatten_index(input_list)
+def flatten_index(element,
+                  input_list: list,
+                  *,
+                  path: bool = False
+                  ) -> Union[int, Tuple[int, Tuple[int, ...]]]:
+    r"""flatools.flatten_index(element, input_list, *[, path])
 
     Returns the index of the first instance of an element in a flatten list.
     Usage:
@@ -23,9 +28,56 @@ def flatten_index(element, input_list: list) -> int:
     >>> alist = [[1, 2], [3, 4], [5, 6]]
     >>> flatools.flatten_index(7, alist)
     ValueError: 7 is not in list
+
+    The search stops at the first match, so the rest of the list is never
+    traversed. Setting the optional argument 'path' to True makes the function
+    return a tuple containing both the flat index and the path of indices
+    leading to the element in the nested list:
+
+    >>> alist = [1, [2, [3, 4]], [5, 6]]
+    >>> flatools.flatten_index(4, alist, path=True)
+    (3, (1, 1, 1))
+    >>> alist[1][1][1]
+    4
     """
     if isinstance(element, list):
         raise TypeError('\'element\' must not be \'list\'')
     if not isinstance(input_list, list):
         raise TypeError('\'input_list\' must be \'list\'')
-    return flatten(input_list).index(element)
+    if not isinstance(path, bool):
+        raise TypeError('\'path\' must be \'bool\'')
+    if path:
+        return _flatten_index_path(element, input_list)
+    for index, item in enumerate(iflatten(input_list)):
+        if item is element or item == element:
+            return index
+    raise ValueError('{!r} is not in list'.format(element))
+
+
+def _flatten_index_path(element,
+                        input_list: list
+                        ) -> Tuple[int, Tuple[int, ...]]:
+    r"""Returns the flat index and the nested index path of the first instance
+    of element in input_list, keeping track of the position within each list
+    currently being traversed.
+    """
+    flat_index = 0
+    index_path = []
+    stack = []
+    iterator = enumerate(input_list)
+    while True:
+        for i, item in iterator:
+            if isinstance(item, list):
+                stack.append(iterator)
+                index_path.append(i)
+                iterator = enumerate(item)
+                break
+            if item is element or item == element:
+                index_path.append(i)
+                return flat_index, tuple(index_path)
+            flat_index += 1
+        else:
+            if not stack:
+                raise ValueError('{!r} is not in list'.format(element))
+            iterator = stack.pop()
+            index_path.pop()
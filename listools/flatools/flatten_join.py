@@ -1,4 +1,4 @@
-from .flatten import flatten
+from .flatten import _flatten_aux
 
 
 def flatten_join(*input_lists: list) -> list:
@@ -35,5 +35,5 @@ def flatten_join(*input_lists: list) -> list:
         raise TypeError('\'*input_lists\' must be one or more \'list\'')
     output_list = []
     for input_list in input_lists:
-        output_list += (flatten(input_list))
+        _flatten_aux(input_list, output_list)
     return output_list
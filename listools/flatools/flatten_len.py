@@ -1,4 +1,4 @@
-from .flatten import flatten
+from .iflatten import iflatten
 
 
 def flatten_len(input_list: list) -> int:
@@ -19,4 +19,7 @@ def flatten_len(input_list: list) -> int:
     """
     if not isinstance(input_list, list):
         raise TypeError('\'input_list\' must be \'list\'')
-    return len(flatten(input_list))
+    count = 0
+    for count, _ in enumerate(iflatten(input_list), 1):
+        pass
+    return count
@@ -1,5 +1,8 @@
 from numbers import Number
-from .flatten import flatten
+from .._numpy import as_flat_array as _as_flat_array
+from .._numpy import is_ndarray as _is_ndarray
+from .._numpy import max_array as _max_array
+from .iflatten import iflatten
 
 
 def flatten_max(input_list: list,
@@ -50,13 +53,27 @@ def flatten_max(input_list: list,
     3
     >>> print(flatten_max(blist, default=-100))
     -100
+
+    If NumPy is installed, the input can also be a NumPy array. NumPy is also
+    used automatically for large rectangular lists whose elements are all
+    ints, which are converted into an array and reduced with vectorised
+    operations instead of element by element. Floats are always compared by
+    the built-in max(), so the result does not depend on whether NumPy is
+    installed.
     """
-    if not isinstance(input_list, list):
+    if not isinstance(input_list, list) and not _is_ndarray(input_list):
         raise TypeError('\'input_list\' must be \'list\'')
+    array = _as_flat_array(input_list, float_lists=False)
+    if array is not None:
+        if array.size == 0:
+            return default
+        if key:
+            return max(array.tolist(), key=key)
+        return _max_array(array)
     # not very elegant, but max(input, key=None) raises "TypeError: 'NoneType'
     # object is not callable. Other functions such as sorted(input, key=None)
     # work exactly as expected when key=None.
     if key:
-        return max(flatten(input_list), key=key, default=default)
+        return max(iflatten(input_list), key=key, default=default)
     else:
-        return max(flatten(input_list), default=default)
+        return max(iflatten(input_list), default=default)
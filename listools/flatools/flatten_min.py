@@ -1,5 +1,8 @@
 from numbers import Number
-from .flatten import flatten
+from .._numpy import as_flat_array as _as_flat_array
+from .._numpy import is_ndarray as _is_ndarray
+from .._numpy import min_array as _min_array
+from .iflatten import iflatten
 
 
 def flatten_min(input_list: list,
@@ -50,13 +53,27 @@ def flatten_min(input_list: list,
     1
     >>> print(flatten_min(blist, default=-100))
     -100
+
+    If NumPy is installed, the input can also be a NumPy array. NumPy is also
+    used automatically for large rectangular lists whose elements are all
+    ints, which are converted into an array and reduced with vectorised
+    operations instead of element by element. Floats are always compared by
+    the built-in min(), so the result does not depend on whether NumPy is
+    installed.
     """
-    if not isinstance(input_list, list):
+    if not isinstance(input_list, list) and not _is_ndarray(input_list):
         raise TypeError('\'input_list\' must be \'list\'')
+    array = _as_flat_array(input_list, float_lists=False)
+    if array is not None:
+        if array.size == 0:
+            return default
+        if key:
+            return min(array.tolist(), key=key)
+        return _min_array(array)
     # not very elegant, but min(input, key=None) raises "TypeError: 'NoneType'
     # object is not callable". Meanwhile, sorted(input, key=None) works exactly
     # as expected.
     if key:
-        return min(flatten(input_list), key=key, default=default)
+        return min(iflatten(input_list), key=key, default=default)
     else:
-        return min(flatten(input_list), default=default)
+        return min(iflatten(input_list), default=default)
@@ -0,0 +1,74 @@
+from typing import Any, Tuple
+from .._numpy import as_flat_array as _as_flat_array
+from .._numpy import is_ndarray as _is_ndarray
+from .iflatten import iflatten
+
+
+def flatten_minmax(input_list: list,
+                   *,
+                   key: 'function' = None,
+                   default=None
+                   ) -> Tuple[Any, Any]:
+    r"""flatools.flatten_minmax(input_list, *[, key, default])
+
+    Finds both the smallest and the largest elements of a flattened list
+    containing any number of nested subslists, returning them as a tuple.
+    Usage:
+
+    >>> alist = [[1, 4], [5, 7], [2], [9, 6, 10], [8, 3]]
+    >>> flatools.flatten_minmax(alist)
+    (1, 10)
+
+    >>> alist = [[3, 1.4], [5, 7.8], [-3.1, 6.6]]
+    >>> flatools.flatten_minmax(alist)
+    (-3.1, 7.8)
+
+    It takes the same optional arguments as flatools.flatten_min() and
+    flatools.flatten_max(), and gives the same results as calling both of them,
+    but the list is traversed only once.
+
+    >>> alist = [-1, -5, [3, [-2, 4]]]
+    >>> flatools.flatten_minmax(alist, key=abs)
+    (-1, -5)
+
+    >>> alist = []
+    >>> flatools.flatten_minmax(alist, default=-100)
+    (-100, -100)
+
+    If NumPy is installed, the input can also be a NumPy array. NumPy is also
+    used automatically for large rectangular lists whose elements are all
+    ints, which are converted into an array and reduced with vectorised
+    operations instead of element by element. Floats are always compared one
+    by one, so the result does not depend on whether NumPy is installed.
+    """
+    if not isinstance(input_list, list) and not _is_ndarray(input_list):
+        raise TypeError('\'input_list\' must be \'list\'')
+    array = _as_flat_array(input_list, float_lists=False)
+    if array is not None:
+        if array.size == 0:
+            return default, default
+        if key is None and array.dtype.kind in 'iu':
+            return array.min().item(), array.max().item()
+        iterator = iter(array.tolist())
+    else:
+        iterator = iflatten(input_list)
+    for minimum in iterator:
+        break
+    else:
+        return default, default
+    maximum = minimum
+    if key is None:
+        for element in iterator:
+            if element < minimum:
+                minimum = element
+            elif element > maximum:
+                maximum = element
+        return minimum, maximum
+    minimum_key = maximum_key = key(minimum)
+    for element in iterator:
+        element_key = key(element)
+        if element_key < minimum_key:
+            minimum, minimum_key = element, element_key
+        elif element_key > maximum_key:
+            maximum, maximum_key = element, element_key
+    return minimum, maximum
@@ -0,0 +1,38 @@
+from heapq import nlargest as _nlargest
+from .iflatten import iflatten
+
+
+def flatten_nlargest(input_list: list,
+                     n: int,
+                     *,
+                     key: 'function' = None
+                     ) -> list:
+    r"""flatools.flatten_nlargest(input_list, n, *[, key])
+
+    Returns a list with the n largest elements of a flattened list containing
+    any number of nested subslists, in descending order. Usage:
+
+    >>> alist = [[1, 4], [5, 7], [2], [9, 6, 10], [8, 3]]
+    >>> flatools.flatten_nlargest(alist, 3)
+    [10, 9, 8]
+
+    >>> alist = [[3, 1.4], [5, 7.8], [-3.1, 6.6]]
+    >>> flatools.flatten_nlargest(alist, 2)
+    [7.8, 6.6]
+
+    The optional argument 'key' takes a function that serves as a key for the
+    comparison:
+
+    >>> alist = [-1, -5, [3, [-2, 4]]]
+    >>> flatools.flatten_nlargest(alist, 2, key=abs)
+    [-5, 4]
+
+    It is equivalent to flatools.flatten_sorted(input_list, reverse=True)[:n],
+    but the elements are streamed through a heap of size n, so the list is
+    neither copied nor fully sorted.
+    """
+    if not isinstance(input_list, list):
+        raise TypeError('\'input_list\' must be \'list\'')
+    if not isinstance(n, int):
+        raise TypeError('\'n\' must be \'int\'')
+    return _nlargest(n, iflatten(input_list), key=key)
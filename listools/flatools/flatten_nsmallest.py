@@ -0,0 +1,38 @@
+from heapq import nsmallest as _nsmallest
+from .iflatten import iflatten
+
+
+def flatten_nsmallest(input_list: list,
+                      n: int,
+                      *,
+                      key: 'function' = None
+                      ) -> list:
+    r"""flatools.flatten_nsmallest(input_list, n, *[, key])
+
+    Returns a list with the n smallest elements of a flattened list containing
+    any number of nested subslists, in ascending order. Usage:
+
+    >>> alist = [[1, 4], [5, 7], [2], [9, 6, 10], [8, 3]]
+    >>> flatools.flatten_nsmallest(alist, 3)
+    [1, 2, 3]
+
+    >>> alist = [[3, 1.4], [5, 7.8], [-3.1, 6.6]]
+    >>> flatools.flatten_nsmallest(alist, 2)
+    [-3.1, 1.4]
+
+    The optional argument 'key' takes a function that serves as a key for the
+    comparison:
+
+    >>> alist = [-1, -5, [3, [-2, 4]]]
+    >>> flatools.flatten_nsmallest(alist, 2, key=abs)
+    [-1, -2]
+
+    It is equivalent to flatools.flatten_sorted(input_list)[:n], but the
+    elements are streamed through a heap of size n, so the list is neither
+    copied nor fully sorted.
+    """
+    if not isinstance(input_list, list):
+        raise TypeError('\'input_list\' must be \'list\'')
+    if not isinstance(n, int):
+        raise TypeError('\'n\' must be \'int\'')
+    return _nsmallest(n, iflatten(input_list), key=key)
@@ -0,0 +1,177 @@
+from .flatten import _flatten_aux
+
+_RUN = 0
+_OPEN = 1
+_CLOSE = 2
+
+
+class FlattenPlan:
+    r"""flatools.FlattenPlan(example)
+
+    Flattening plan compiled from an example list containing any number of
+    nested sublists, for flattening many lists which share the same nesting
+    structure. Calling the plan on a list returns the same result as
+    flatools.flatten(). Usage:
+
+    >>> plan = flatools.FlattenPlan([[1, 2], [3, [4, 5]]])
+    >>> plan([['a', 'b'], ['c', ['d', 'e']]])
+    ['a', 'b', 'c', 'd', 'e']
+    >>> plan.size
+    5
+    >>> plan.paths
+    ((0, 0), (0, 1), (1, 0), (1, 1, 0), (1, 1, 1))
+
+    The example is traversed once, and its structure is compiled into a
+    function which gathers the elements of a list directly from their paths,
+    copying whole sublists at once whenever possible. Applying the plan only
+    checks the types and lengths of the sublists and the types of the gathered
+    elements, at C speed, instead of checking every element one by one as
+    flatools.flatten() does. Lists which do not match the example are
+    flattened the usual way instead:
+
+    >>> plan.matches([[1, 2], [3, 4]])
+    False
+    >>> plan([[1, 2], [3, 4]])
+    [1, 2, 3, 4]
+    """
+
+    __slots__ = ('_ops', '_gather', '_leaf_types', 'size')
+
+    def __init__(self, example: list) -> None:
+        if not isinstance(example, list):
+            raise TypeError('\'example\' must be \'list\'')
+        self._ops, self.size = _compile(example)
+        self._gather = _gather_function(self._ops, len(example))
+        self._leaf_types = set()
+
+    def __call__(self, record: list) -> list:
+        output_list = self._gather(record)
+        if output_list is not None and self._are_leaves(output_list):
+            return output_list
+        if not isinstance(record, list):
+            raise TypeError('\'record\' must be \'list\'')
+        return _flatten_aux(record, [])
+
+    def __repr__(self) -> str:
+        return 'FlattenPlan(size={!r})'.format(self.size)
+
+    def matches(self, record) -> bool:
+        r"""Returns True if record has the same nesting structure as the
+        example the plan was compiled from.
+        """
+        output_list = self._gather(record)
+        return output_list is not None and self._are_leaves(output_list)
+
+    @property
+    def paths(self) -> tuple:
+        r"""Tuple containing the path of indices leading to every element of
+        the flattened example, in flatten order.
+        """
+        paths = []
+        prefix = ()
+        stack = []
+        for code, start, stop in self._ops:
+            if code == _RUN:
+                paths += [prefix + (i, ) for i in range(start, stop)]
+            elif code == _OPEN:
+                stack.append(prefix)
+                prefix = prefix + (start, )
+            else:
+                prefix = stack.pop()
+        return tuple(paths)
+
+    def _are_leaves(self, output_list: list) -> bool:
+        r"""Returns True if none of the gathered elements is a list. The types
+        already known not to be lists are cached, so that this usually costs
+        a single set comparison.
+        """
+        types = set(map(type, output_list))
+        if types <= self._leaf_types:
+            return True
+        if any(issubclass(element_type, list) for element_type in types):
+            return False
+        self._leaf_types |= types
+        return True
+
+
+def _compile(example: list) -> tuple:
+    r"""Traverses example once, without recursion, and returns its plan as a
+    tuple of instructions, together with its number of flattened elements.
+    Each instruction is a tuple (code, start, stop), where code is either
+    _RUN, for copying node[start:stop] (which contains no sublists), _OPEN, for
+    descending into node[start] (which is a sublist of length stop), or
+    _CLOSE, for going back to the parent node.
+    """
+    ops = []
+    append = ops.append
+    size = 0
+    stack = []
+    node = example
+    iterator = enumerate(example)
+    run_start = 0
+    while True:
+        for i, element in iterator:
+            if isinstance(element, list):
+                if i > run_start:
+                    append((_RUN, run_start, i))
+                    size += i - run_start
+                append((_OPEN, i, len(element)))
+                stack.append((node, iterator, i + 1))
+                node = element
+                iterator = enumerate(element)
+                run_start = 0
+                break
+        else:
+            if len(node) > run_start:
+                append((_RUN, run_start, len(node)))
+                size += len(node) - run_start
+            if not stack:
+                return tuple(ops), size
+            append((_CLOSE, 0, 0))
+            node, iterator, run_start = stack.pop()
+
+
+def _gather_function(ops: tuple, length: int):
+    r"""Generates the source code of a function which takes a list and returns
+    the elements found at the paths described by ops, or None if the list
+    does not have the nesting structure of ops, and compiles it.
+    """
+    lines = []
+    names = ['record']
+    lengths = [length]
+    items = []
+    node, node_length = 'record', length
+    stack = []
+    for code, start, stop in ops:
+        if code == _RUN:
+            if start == 0 and stop == node_length:
+                items.append('*{}'.format(node))
+            elif stop - start == 1:
+                items.append('{}[{}]'.format(node, start))
+            else:
+                items.append('*{}[{}:{}]'.format(node, start, stop))
+        elif code == _OPEN:
+            stack.append((node, node_length))
+            name = 'node{}'.format(len(names))
+            lines.append('        {} = {}[{}]'.format(name, node, start))
+            names.append(name)
+            lengths.append(stop)
+            node, node_length = name, stop
+        else:
+            node, node_length = stack.pop()
+    source = '\n'.join([
+        'def gather(record):',
+        '    try:',
+    ] + (lines or ['        pass']) + [
+        '    except (IndexError, KeyError, TypeError):',
+        '        return None',
+        '    nodes = ({}, )'.format(', '.join(names)),
+        '    if list(map(type, nodes)) != types:',
+        '        return None',
+        '    if list(map(len, nodes)) != lengths:',
+        '        return None',
+        '    return [{}]'.format(', '.join(items)),
+    ])
+    namespace = {'types': [list] * len(names), 'lengths': lengths}
+    exec(source, namespace)
+    return namespace['gather']
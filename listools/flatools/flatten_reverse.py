@@ -1,3 +1,6 @@
+from .._numpy import as_flat_array as _as_flat_array
+from .._numpy import is_ndarray as _is_ndarray
+from .._numpy import sort_array as _sort_array
 from .flatten import flatten
 
 
@@ -26,7 +29,15 @@ def flatten_reverse(input_list: list) -> list:
     >>> alist = [[3, 1.4], [5, 7.8], [-3.1, 6.6]]
     >>> flatools.flatten_reverse(alist)
     [7.8, 6.6, 5, 3, 1.4, -3.1]
+
+    If NumPy is installed, the input can also be a NumPy array. NumPy is also
+    used automatically for large rectangular lists whose elements are all ints
+    or all floats, which are converted into an array and sorted with vectorised
+    operations instead of element by element.
     """
-    if not isinstance(input_list, list):
+    if not isinstance(input_list, list) and not _is_ndarray(input_list):
         raise TypeError('\'input_list\' must be \'list\'')
+    array = _as_flat_array(input_list)
+    if array is not None:
+        return _sort_array(array, reverse=True)
     return sorted(flatten(input_list), reverse=True)
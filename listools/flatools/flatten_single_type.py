@@ -1,4 +1,6 @@
-from .flatten import flatten
+from .._numpy import is_ndarray as _is_ndarray
+from .._types import count_types as _count_types
+from .iflatten import iflatten
 
 
 def flatten_single_type(input_list: list) -> bool:
@@ -32,7 +34,16 @@ def flatten_single_type(input_list: list) -> bool:
     >>> alist = []
     >>> flatools.flatten_single_type(alist)
     False
+
+    The elements are streamed from the nested sublists only until one of a
+    different type is found. If NumPy is installed, the input can also be a
+    NumPy array, in which case its dtype is used to answer without scanning
+    its elements, unless it is of dtype object.
     """
+    if _is_ndarray(input_list):
+        if input_list.dtype.kind != 'O':
+            return input_list.size > 0
+        return _count_types(input_list.ravel()) == 1
     if not isinstance(input_list, list):
         raise TypeError('\'input_list\' must be \'list\'')
-    return len(set(map(type, flatten(input_list)))) == 1
+    return _count_types(iflatten(input_list)) == 1
@@ -1,3 +1,6 @@
+from .._numpy import as_flat_array as _as_flat_array
+from .._numpy import is_ndarray as _is_ndarray
+from .._numpy import sort_array as _sort_array
 from .flatten import flatten
 
 
@@ -45,7 +48,21 @@ def flatten_sorted(input_list: list,
     >>> alist = [1, 5, [3, [2, 4]]]
     >>> print(flatten_sorted(alist, reverse=True))
     [5, 4, 3, 2, 1]
+
+    The runs of already sorted elements are detected and merged by the built-in
+    sorted() itself. To get the sorted elements lazily instead, use
+    flatools.iflatten_sorted().
+
+    If NumPy is installed, the input can also be a NumPy array. NumPy is also
+    used automatically for large rectangular lists whose elements are all ints
+    or all floats, which are converted into an array and sorted with vectorised
+    operations instead of element by element.
     """
-    if not isinstance(input_list, list):
+    if not isinstance(input_list, list) and not _is_ndarray(input_list):
         raise TypeError('\'input_list\' must be \'list\'')
+    array = _as_flat_array(input_list)
+    if array is not None:
+        if key is None:
+            return _sort_array(array, reverse=reverse)
+        return sorted(array.tolist(), key=key, reverse=reverse)
     return sorted(flatten(input_list), key=key, reverse=reverse)
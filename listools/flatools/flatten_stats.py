@@ -0,0 +1,133 @@
+class FlattenStats:
+    r"""Result of flatools.flatten_stats(). Its attributes are:
+
+    count: number of elements of the flattened list.
+    sum: sum of all elements, or None if they cannot be added together.
+    min: smallest element, or None if the list is empty or if its elements
+         cannot be compared.
+    max: largest element, or None if the list is empty or if its elements
+         cannot be compared.
+    types: set containing the type of every element.
+    max_depth: nesting depth of the most deeply nested element, where the
+               elements of the input list itself are at depth 1 (or 0 if the
+               list is empty).
+    depth_counts: dictionary mapping each depth to the number of elements
+                  found at it.
+    """
+
+    __slots__ = ('count', 'sum', 'min', 'max', 'types', 'max_depth',
+                 'depth_counts')
+
+    def __init__(self,
+                 count: int,
+                 sum,
+                 min,
+                 max,
+                 types: set,
+                 max_depth: int,
+                 depth_counts: dict,
+                 ) -> None:
+        self.count = count
+        self.sum = sum
+        self.min = min
+        self.max = max
+        self.types = types
+        self.max_depth = max_depth
+        self.depth_counts = depth_counts
+
+    def __repr__(self) -> str:
+        return ('FlattenStats(count={!r}, sum={!r}, min={!r}, max={!r}, '
+                'types={!r}, max_depth={!r}, depth_counts={!r})'.format(
+                    self.count, self.sum, self.min, self.max, self.types,
+                    self.max_depth, self.depth_counts))
+
+
+def flatten_stats(input_list: list, start=0) -> FlattenStats:
+    r"""flatools.flatten_stats(input_list[, start])
+
+    Computes in a single pass the length, sum, minimum, maximum and the types
+    of all elements of a list containing any number of nested sublists, as well
+    as how deeply they are nested. Usage:
+
+    >>> alist = [1, [2, [3, 4]], [5.0]]
+    >>> stats = flatools.flatten_stats(alist)
+    >>> stats.count
+    5
+    >>> stats.sum
+    15.0
+    >>> stats.min, stats.max
+    (1, 5.0)
+    >>> stats.types
+    {<class 'int'>, <class 'float'>}
+    >>> stats.max_depth
+    3
+    >>> stats.depth_counts
+    {1: 1, 2: 2, 3: 2}
+
+    This gives the same results as calling flatools.flatten_len(),
+    flatools.flatten_sum(), flatools.flatten_min() and flatools.flatten_max()
+    one after another, but the list is traversed only once and never copied.
+    The optional argument 'start' defines the starting value of the sum, as in
+    flatools.flatten_sum().
+
+    Elements of any types are accepted. If they cannot be added together, sum
+    is None; if they cannot be compared, min and max are None:
+
+    >>> alist = [1, ['foo', [None]]]
+    >>> stats = flatools.flatten_stats(alist)
+    >>> stats.count
+    3
+    >>> print(stats.sum, stats.min, stats.max)
+    None None None
+    """
+    if not isinstance(input_list, list):
+        raise TypeError('\'input_list\' must be \'list\'')
+    count = 0
+    total = start
+    summing = True
+    minimum = maximum = None
+    comparing = True
+    types = set()
+    add_type = types.add
+    level_counts = [0]
+    stack = []
+    iterator = iter(input_list)
+    while True:
+        for element in iterator:
+            if isinstance(element, list):
+                stack.append(iterator)
+                iterator = iter(element)
+                if len(stack) == len(level_counts):
+                    level_counts.append(0)
+                break
+            level_counts[len(stack)] += 1
+            add_type(type(element))
+            if summing:
+                try:
+                    total = total + element
+                except TypeError:
+                    total = None
+                    summing = False
+            if comparing:
+                if count == 0:
+                    minimum = maximum = element
+                else:
+                    try:
+                        if element < minimum:
+                            minimum = element
+                        elif element > maximum:
+                            maximum = element
+                    except TypeError:
+                        minimum = maximum = None
+                        comparing = False
+            count += 1
+        else:
+            if not stack:
+                break
+            iterator = stack.pop()
+    depth_counts = {depth: level_count
+                    for depth, level_count in enumerate(level_counts, 1)
+                    if level_count}
+    max_depth = max(depth_counts) if depth_counts else 0
+    return FlattenStats(count, total, minimum, maximum, types, max_depth,
+                        depth_counts)
@@ -1,8 +1,20 @@
-from .flatten import flatten
+from itertools import chain as _chain
+from itertools import islice as _islice
+from math import fsum as _fsum
+from .._numpy import as_flat_array as _as_flat_array
+from .._numpy import is_ndarray as _is_ndarray
+from .._numpy import sum_array as _sum_array
+from .iflatten import _iflatten_runs, iflatten
 
+_MODES = ('default', 'exact', 'int', 'pairwise')
 
-def flatten_sum(input_list: list, start=0):
-    r"""flatools.flatten_sum(input_list[, start])
+# Number of elements summed sequentially before partial sums are combined
+# pairwise in the 'pairwise' mode.
+_CHUNK_SIZE = 1024
+
+
+def flatten_sum(input_list: list, start=0, *, mode: str = 'default'):
+    r"""flatools.flatten_sum(input_list[, start, *, mode])
 
     Sums all values of the list, including any nested subslists. Usage:
 
@@ -32,7 +44,101 @@ def flatten_sum(input_list: list, start=0):
     >>> alist = [1, [2, [3]]]
     >>> flatools.flatten_sum(alist, start=4)
     10
+
+    If NumPy is installed, the input can also be a NumPy array. NumPy is also
+    used automatically for large rectangular lists whose elements are all
+    ints, which are converted into an array and summed with vectorised
+    operations instead of element by element. Floats are always summed by the
+    built-in sum(), so the result does not depend on whether NumPy is
+    installed.
+
+    The optional keyword argument 'mode' selects how the elements are added
+    together. The default mode, 'default', behaves just like the built-in
+    sum(). The other modes process the list in runs of consecutive elements of
+    a same sublist, so they are the fastest for lists of long sublists of
+    numbers:
+
+    'exact' returns the correctly rounded float sum (using math.fsum()), so
+    rounding errors do not accumulate and the result does not depend on the
+    order of the elements:
+
+    >>> alist = [[0.1] * 5, [0.1] * 5]
+    >>> flatools.flatten_sum(alist)
+    0.9999999999999999
+    >>> flatools.flatten_sum(alist, mode='exact')
+    1.0
+
+    'int' only accepts integers (raising a TypeError otherwise) and sums each
+    run with the integer fast path of the built-in sum():
+
+    >>> alist = [[1, 2], [3, 4], [5, 6]]
+    >>> flatools.flatten_sum(alist, mode='int')
+    21
+
+    'pairwise' sums chunks of consecutive elements and then adds the partial
+    sums pairwise, which reduces the accumulation of rounding errors for
+    floats to a logarithmic growth while streaming the elements:
+
+    >>> alist = [[0.1] * 5, [0.1] * 5]
+    >>> flatools.flatten_sum(alist, mode='pairwise')
+    0.9999999999999999
     """
-    if not isinstance(input_list, list):
+    if not isinstance(input_list, list) and not _is_ndarray(input_list):
         raise TypeError('\'input_list\' must be \'list\'')
-    return sum(flatten(input_list), start)
+    if mode not in _MODES:
+        raise ValueError('\'mode\' must be one of \'default\', \'exact\', '
+                         '\'int\' or \'pairwise\'')
+    if mode == 'default':
+        array = _as_flat_array(input_list, float_lists=False)
+        if array is not None:
+            return _sum_array(array, start)
+        return sum(iflatten(input_list), start)
+    if _is_ndarray(input_list):
+        runs = (input_list.ravel().tolist(), )
+    else:
+        runs = _iflatten_runs(input_list)
+    if mode == 'exact':
+        return _fsum(_chain((start, ), _chain.from_iterable(runs)))
+    if mode == 'int':
+        return _sum_int(runs, start)
+    return _sum_pairwise(runs, start)
+
+
+def _sum_int(runs, start):
+    r"""Sums runs of integers, raising a TypeError at the first run containing
+    anything else.
+    """
+    total = start
+    for run in runs:
+        # adding a float, complex, Fraction or Decimal to an int never results
+        # in an int, so checking the type of each partial sum is enough
+        partial_sum = sum(run)
+        if type(partial_sum) is not int:
+            raise TypeError('all elements of \'input_list\' must be \'int\'')
+        total += partial_sum
+    return total
+
+
+def _sum_pairwise(runs, start):
+    r"""Sums the elements of runs in chunks of _CHUNK_SIZE elements, combining
+    the partial sums pairwise. Partial sums are kept in a stack together with
+    the number of chunks they cover, and the top two are added whenever they
+    cover the same number of chunks, so the stack never holds more than
+    log2(n / _CHUNK_SIZE) partial sums.
+    """
+    elements = _chain.from_iterable(runs)
+    stack = []
+    while True:
+        chunk = list(_islice(elements, _CHUNK_SIZE))
+        if not chunk:
+            break
+        partial_sum = sum(chunk)
+        size = 1
+        while stack and stack[-1][1] == size:
+            partial_sum = stack.pop()[0] + partial_sum
+            size *= 2
+        stack.append((partial_sum, size))
+    total = 0
+    while stack:
+        total = stack.pop()[0] + total
+    return start + total
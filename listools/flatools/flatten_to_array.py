@@ -0,0 +1,100 @@
+from array import array as _array
+from array import typecodes as _typecodes
+from .iflatten import _iflatten_runs
+
+# Runs copied into a user supplied buffer are converted in blocks of at most
+# this many elements, so that the temporary arrays stay small.
+_CHUNK_SIZE = 4096
+
+
+def flatten_to_array(input_list: list,
+                     typecode: str = 'd',
+                     *,
+                     out=None
+                     ):
+    r"""flatools.flatten_to_array(input_list[, typecode, *, out])
+
+    Completely flattens a list containing any number of nested subslists into
+    an array.array of the given typecode (by default 'd', that is, C doubles).
+    Usage:
+
+    >>> alist = [[1.5, 2.0], [3.25, [4.0]]]
+    >>> flatools.flatten_to_array(alist)
+    array('d', [1.5, 2.0, 3.25, 4.0])
+
+    >>> alist = [1, [2, [3, 4]], 5]
+    >>> flatools.flatten_to_array(alist, 'i')
+    array('i', [1, 2, 3, 4, 5])
+
+    The elements are stored unboxed, so that the result takes a fraction of the
+    memory of the list returned by flatools.flatten() and can be handed over to
+    anything supporting the buffer protocol without being copied. The elements
+    are streamed straight into the array, and no intermediate flattened list is
+    built. An element which cannot be stored with the given typecode raises the
+    same exception as array.array would (TypeError or OverflowError):
+
+    >>> flatools.flatten_to_array([1, [2, 'foo']])
+    Traceback (most recent call last):
+       ...
+    TypeError: must be real number, not str
+
+    Instead of creating a new array, the elements can be written into an
+    existing writable buffer (e.g. an array.array, a bytearray or a NumPy
+    array) given by the optional keyword argument 'out'. Its memory is
+    interpreted according to typecode, and a memoryview of the filled part of
+    it is returned. A ValueError is raised if it is too small:
+
+    >>> from array import array
+    >>> buffer = array('d', [0.0] * 5)
+    >>> view = flatools.flatten_to_array([1.0, [2.0, 3.0]], out=buffer)
+    >>> view.tolist()
+    [1.0, 2.0, 3.0]
+    >>> buffer
+    array('d', [1.0, 2.0, 3.0, 0.0, 0.0])
+    """
+    if not isinstance(input_list, list):
+        raise TypeError('\'input_list\' must be \'list\'')
+    if not isinstance(typecode, str):
+        raise TypeError('\'typecode\' must be \'str\'')
+    if typecode not in _typecodes:
+        raise ValueError('\'typecode\' must be one of {!r}'.format(_typecodes))
+    if out is None:
+        # array.extend() over-allocates geometrically, so that the array grows
+        # in amortised constant time per element.
+        output_array = _array(typecode)
+        for run in _iflatten_runs(input_list):
+            output_array.extend(run)
+        return output_array
+    view = _writable_view(out, typecode)
+    position = 0
+    for run in _iflatten_runs(input_list):
+        for start in range(0, len(run), _CHUNK_SIZE):
+            values = _array(typecode, run[start:start + _CHUNK_SIZE])
+            stop = position + len(values)
+            if stop > len(view):
+                raise ValueError('\'out\' is too small to hold the flattened '
+                                 'list')
+            view[position:stop] = values
+            position = stop
+    return view[:position]
+
+
+def _writable_view(out, typecode: str) -> memoryview:
+    r"""Returns a one dimensional memoryview of out with elements of the given
+    typecode.
+    """
+    try:
+        view = memoryview(out)
+    except TypeError:
+        raise TypeError('\'out\' must support the buffer protocol') from None
+    if view.readonly:
+        raise TypeError('\'out\' must be a writable buffer')
+    if view.format != typecode or view.ndim != 1:
+        if not view.c_contiguous:
+            raise ValueError('\'out\' must be contiguous')
+        view = view.cast('B')
+        if len(view) % _array(typecode).itemsize != 0:
+            raise ValueError('the size of \'out\' must be a multiple of the '
+                             'item size of \'typecode\'')
+        view = view.cast(typecode)
+    return view
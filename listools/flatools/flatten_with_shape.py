@@ -0,0 +1,26 @@
+from .flat_shape import _from_codes, _shape_codes
+
+
+def flatten_with_shape(input_list: list) -> tuple:
+    r"""flatools.flatten_with_shape(input_list)
+
+    Completely flattens a list containing any number of nested subslists and
+    also returns its nesting structure as a flatools.FlatShape, so that the
+    flattened list (or any list of the same length) can later be nested back
+    with flatools.unflatten(). Usage:
+
+    >>> alist = [1, [2, [3, 4]], [5]]
+    >>> flat, shape = flatools.flatten_with_shape(alist)
+    >>> flat
+    [1, 2, 3, 4, 5]
+    >>> flatools.unflatten([x * 10 for x in flat], shape)
+    [10, [20, [30, 40]], [50]]
+
+    The structure is captured during the same single pass which flattens the
+    list.
+    """
+    if not isinstance(input_list, list):
+        raise TypeError('\'input_list\' must be \'list\'')
+    output_list = []
+    codes, size = _shape_codes(input_list, output_list)
+    return output_list, _from_codes(codes, size)
@@ -1,4 +1,8 @@
-from .flatten import flatten
+from itertools import chain as _chain
+from itertools import repeat as _repeat
+from .iflatten import iflatten
+
+_MISSING = object()
 
 
 def flatten_zip_cycle(*input_lists) -> tuple:
@@ -43,17 +47,46 @@ def flatten_zip_cycle(*input_lists) -> tuple:
     True False
     None bar
 
-    Note that unlike flatools.flatten_zip_cycle(), this function accepts only
-    lists as input due to its flatenning function.
+    Note that unlike iterz.zip_cycle(), this function accepts only lists as
+    input due to its flatenning function.
+
+    The input lists are flattened lazily while being zipped, so the first
+    tuple is yielded straight away. Only the elements needed for cycling the
+    shorter lists are kept in memory: the elements of each list are stored
+    until it is known not to be the longest one.
     """
     if not all(isinstance(input_list, list) for input_list in input_lists):
         raise TypeError('\'*input_lists\' must be one or more \'list\'')
-    flatten_lists = []
-    for input_list in input_lists:
-        flatten_lists.append(flatten(input_list))
-    max_length = max([len(flatten_list) for flatten_list in flatten_lists])
-    for i in range(max_length):
+    if not input_lists:
+        raise ValueError('\'*input_lists\' must be one or more \'list\'')
+    streams = [iflatten(input_list) for input_list in input_lists]
+    buffers = [[] for _ in streams]
+    streaming = [True for _ in streams]
+    n_streaming = len(streams)
+    if n_streaming == 1:
+        buffers[0] = None
+    while True:
         output_list = []
-        for flatten_list in flatten_lists:
-            output_list.append(flatten_list[i % len(flatten_list)])
+        exhausted = []
+        for j, stream in enumerate(streams):
+            item = next(stream, _MISSING)
+            if item is _MISSING:
+                exhausted.append(j)
+            elif buffers[j] is not None:
+                buffers[j].append(item)
+            output_list.append(item)
+        if exhausted:
+            n_streaming -= len(exhausted)
+            if n_streaming == 0:
+                return
+            for j in exhausted:
+                if not buffers[j]:
+                    raise IndexError('all elements of \'*input_lists\' must '
+                                     'have len > 0')
+                streams[j] = _chain.from_iterable(_repeat(buffers[j]))
+                output_list[j] = next(streams[j])
+                buffers[j] = None
+                streaming[j] = False
+            if n_streaming == 1:
+                buffers[streaming.index(True)] = None
         yield tuple(output_list)
@@ -0,0 +1,134 @@
+from itertools import repeat as _repeat
+from ._container_types import _dispatch_table, _is_container, _resolve_types
+
+
+def iflatten(input_list: list, *, types: tuple = None):
+    r"""flatools.iflatten(input_list, *[, types])
+
+    Lazy version of flatools.flatten(). Instead of building the whole flattened
+    list, it yields the elements of a list containing any number of nested
+    sublists one at a time. Usage:
+
+    >>> alist = [[1, 2], [3, 4], [5], [6, 7, 8], [9, 10]]
+    >>> for item in flatools.iflatten(alist):
+    ...     print(item)
+    1
+    2
+    3
+    4
+    5
+    6
+    7
+    8
+    9
+    10
+
+    >>> alist = [1, 2, [3, [4, 5]]]
+    >>> iflatten_iter = flatools.iflatten(alist)
+    >>> iflatten_iter.__next__()
+    1
+    >>> list(iflatten_iter)
+    [2, 3, 4, 5]
+
+    Notice that the list themselves can be made out of any datatypes:
+
+    >>> alist = [1, [2.2, True], ['foo', [(1, 4), None]], [3+2j, {'a': 1}]]
+    >>> list(flatools.iflatten(alist))
+    [1, 2.2, True, 'foo', (1, 4), None, 3+2j, {'a': 1}]
+
+    Only the iterators of the sublists currently being traversed are kept in
+    memory, so the extra memory used is proportional to the nesting depth of
+    input_list and not to its number of elements.
+
+    Just like flatools.flatten(), it takes an optional keyword argument 'types'
+    with the types of the containers to be flattened:
+
+    >>> alist = [1, (2, 3), [4, (5, [6])]]
+    >>> list(flatools.iflatten(alist, types=(list, tuple)))
+    [1, 2, 3, 4, 5, 6]
+    """
+    types = _resolve_types(types)
+    if types != (list, ):
+        if not isinstance(input_list, types):
+            raise TypeError('\'input_list\' must be an instance of \'types\'')
+        yield from _iflatten_types_aux(iter(input_list), [], types)
+        return
+    if not isinstance(input_list, list):
+        raise TypeError('\'input_list\' must be \'list\'')
+    yield from _iflatten_aux(iter(input_list), [])
+
+
+def _iflatten_aux(iterator, stack: list):
+    r"""Yields the elements produced by iterator, descending into any sublists
+    it contains. The iterators of the lists still being traversed are kept in
+    stack and resumed once the current one is exhausted, so traversal can also
+    start from the middle of a nested list given a prepared stack.
+    """
+    while True:
+        for element in iterator:
+            if isinstance(element, list):
+                stack.append(iterator)
+                iterator = iter(element)
+                break
+            yield element
+        else:
+            if not stack:
+                return
+            iterator = stack.pop()
+
+
+def _iflatten_types_aux(iterator, stack: list, types: tuple):
+    r"""Same as _iflatten_aux(), but descending into instances of any of the
+    given container types, looked up in a dispatch table by their exact type.
+    """
+    dispatch = _dispatch_table(types)
+    while True:
+        for element in iterator:
+            is_container = dispatch.get(type(element))
+            if is_container is None:
+                is_container = _is_container(dispatch, type(element), types)
+            if is_container:
+                stack.append(iterator)
+                iterator = iter(element)
+                break
+            yield element
+        else:
+            if not stack:
+                return
+            iterator = stack.pop()
+
+
+def _iflatten_runs(input_list: list):
+    r"""Yields the elements of input_list and of its nested sublists in flatten
+    order, grouped into lists of consecutive non-list elements. Lists without
+    any sublists (checked at C speed) are yielded whole instead of being
+    copied, so that consumers can process each run with built-in functions.
+    """
+    stack = []
+    node = input_list
+    iterator = None
+    while True:
+        if iterator is None:
+            if not any(map(isinstance, node, _repeat(list))):
+                if node:
+                    yield node
+                if not stack:
+                    return
+                node, iterator, start = stack.pop()
+                continue
+            iterator = enumerate(node)
+            start = 0
+        for i, element in iterator:
+            if isinstance(element, list):
+                if i > start:
+                    yield node[start:i]
+                stack.append((node, iterator, i + 1))
+                node = element
+                iterator = None
+                break
+        else:
+            if start < len(node):
+                yield node[start:]
+            if not stack:
+                return
+            node, iterator, start = stack.pop()
@@ -0,0 +1,130 @@
+from heapq import merge as _merge
+from itertools import count as _count
+from itertools import islice as _islice
+from operator import ge as _ge
+from operator import itemgetter as _itemgetter
+from operator import le as _le
+
+
+def iflatten_sorted(input_list: list,
+                    *,
+                    key: 'function' = None,
+                    reverse: bool = False
+                    ):
+    r"""flatools.iflatten_sorted(input_list, *[, key, reverse])
+
+    Lazy version of flatools.flatten_sorted(). It yields the elements of a list
+    containing any number of nested sublists in sorted order, one at a time.
+    Usage:
+
+    >>> alist = [[1, 4, 7], [2, 5, 8], [3, 6, 9]]
+    >>> for item in flatools.iflatten_sorted(alist):
+    ...     print(item)
+    1
+    2
+    3
+    4
+    5
+    6
+    7
+    8
+    9
+
+    It takes the same optional arguments 'key' and 'reverse' as
+    flatools.flatten_sorted():
+
+    >>> alist = [-1, -5, [3, [-2, 4]]]
+    >>> list(flatools.iflatten_sorted(alist, key=abs))
+    [-1, -2, 3, 4, -5]
+    >>> list(flatools.iflatten_sorted(alist, reverse=True))
+    [4, 3, -1, -2, -5]
+
+    Each run of consecutive elements of a same list (that is, not interrupted
+    by a sublist) is checked for being already sorted, and all runs are then
+    lazily merged with a heap. This is most efficient when the sublists are
+    already sorted, such as when merging sorted results from several sources,
+    in which case nothing is copied and the extra memory used is proportional
+    to the number of runs. Runs which are not sorted are sorted on their own
+    before being merged. Just like sorted(), the order of equal elements is
+    preserved. When 'key' is given, it is called only once per element, and
+    each run is copied into a list of (key, position, element) triples, which
+    are sorted and merged instead of the elements themselves.
+    """
+    if not isinstance(input_list, list):
+        raise TypeError('\'input_list\' must be \'list\'')
+    if not isinstance(reverse, bool):
+        raise TypeError('\'reverse\' must be \'bool\'')
+    if key is None:
+        yield from _merge(*_sorted_runs(input_list, None, reverse),
+                          reverse=reverse)
+        return
+    yield from map(_itemgetter(2),
+                   _merge(*_sorted_runs(input_list, key, reverse),
+                          reverse=reverse))
+
+
+def _sorted_runs(input_list: list, key, reverse: bool) -> list:
+    r"""Returns the runs of consecutive non-list elements of input_list and of
+    its nested sublists, in flatten order, each of them as an iterable sorted
+    according to key and reverse. If key is given, the runs contain triples
+    (key, position, element) instead, in which position is the index of the
+    element in flatten order (negated if reverse is True), so that equal keys
+    are ordered by position and the elements are never compared.
+    """
+    positions = _count(0, -1 if reverse else 1)
+    runs = []
+    stack = []
+    node = input_list
+    iterator = enumerate(input_list)
+    run_start = None
+    while True:
+        for i, element in iterator:
+            if isinstance(element, list):
+                if run_start is not None:
+                    runs.append(_sorted_run(node, run_start, i, key, reverse,
+                                            positions))
+                stack.append((node, iterator))
+                node = element
+                iterator = enumerate(element)
+                run_start = None
+                break
+            if run_start is None:
+                run_start = i
+        else:
+            if run_start is not None:
+                runs.append(_sorted_run(node, run_start, len(node), key,
+                                        reverse, positions))
+            if not stack:
+                return runs
+            node, iterator = stack.pop()
+            run_start = None
+
+
+def _sorted_run(node: list,
+                start: int,
+                stop: int,
+                key,
+                reverse: bool,
+                positions
+                ):
+    r"""Returns an iterable over node[start:stop] in sorted order. If the run
+    is already sorted, it is iterated in place instead of being copied. If key
+    is given, the run is instead returned as a sorted list of triples (key,
+    position, element), taking the positions from the iterator positions.
+    """
+    if key is not None:
+        run = node[start:stop]
+        run = list(zip(map(key, run), positions, run))
+        run.sort(reverse=reverse)
+        return run
+    if start == 0 and stop == len(node):
+        run = node
+    else:
+        run = _islice(node, start, stop)
+    compare = _ge if reverse else _le
+    if all(map(compare,
+               _islice(node, start, stop - 1),
+               _islice(node, start + 1, stop),
+               )):
+        return run
+    return sorted(node[start:stop], reverse=reverse)
@@ -0,0 +1,62 @@
+from ._container_types import _dispatch_table, _is_container, _resolve_types
+
+
+def ipflatten(input_list: list, depth: int = 1, *, types: tuple = None):
+    r"""flatools.ipflatten(input_list[, depth, *, types])
+
+    Lazy version of flatools.pflatten(). Instead of building the whole
+    partially flattened list, it yields its elements one at a time. Usage:
+
+    >>> alist = [1, 2, [3, [[4], 5]]]
+    >>> for item in flatools.ipflatten(alist):
+    ...     print(item)
+    1
+    2
+    3
+    [[4], 5]
+
+    Use the depth argument (which should always be an integer) when wanting to
+    flatten nested sublists:
+
+    >>> alist = [1, 2, [3, [[4], 5]]]
+    >>> list(flatools.ipflatten(alist, depth=2))
+    [1, 2, 3, [4], 5]
+
+    >>> alist = [1, 2, [3, [4, 5]]]
+    >>> list(flatools.ipflatten(alist, depth=3))
+    [1, 2, 3, 4, 5]
+
+    Just like flatools.pflatten(), it takes an optional keyword argument
+    'types' with the types of the containers to be flattened.
+    """
+    if not isinstance(depth, int):
+        raise TypeError('\'depth\' must be \'int\'')
+    types = _resolve_types(types)
+    if not isinstance(input_list, types):
+        if types == (list, ):
+            raise TypeError('\'input_list\' must be \'list\'')
+        raise TypeError('\'input_list\' must be an instance of \'types\'')
+    if depth < 1:
+        yield from input_list
+        return
+    dispatch = _dispatch_table(types)
+    last_level = depth - 1
+    stack = []
+    iterator = iter(input_list)
+    while True:
+        for element in iterator:
+            is_container = dispatch.get(type(element))
+            if is_container is None:
+                is_container = _is_container(dispatch, type(element), types)
+            if is_container:
+                if len(stack) < last_level:
+                    stack.append(iterator)
+                    iterator = iter(element)
+                    break
+                yield from element
+            else:
+                yield element
+        else:
+            if not stack:
+                return
+            iterator = stack.pop()
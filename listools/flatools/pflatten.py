@@ -1,5 +1,8 @@
-def pflatten(input_list: list, depth: int = 1) -> list:
-    r"""flatools.pflatten(input_list[, depth])
+from ._container_types import _dispatch_table, _is_container, _resolve_types
+
+
+def pflatten(input_list: list, depth: int = 1, *, types: tuple = None) -> list:
+    r"""flatools.pflatten(input_list[, depth, *, types])
 
     Partially flattens a list containing subslists as elements. Usage:
 
@@ -14,7 +17,7 @@ def pflatten(input_list: list, depth: int = 1) -> list:
     Use the depth argument (which should always be an integer) when wanting to
     flatten nested sublists:
 
-    >>> alist = [1, 2, [3, [4, 5]]]
+    >>> alist = [1, 2, [3, [[4], 5]]]
     >>> flatools.pflatten(alist, depth=2)
     [1, 2, 3, [4], 5]
 
@@ -29,20 +32,95 @@ def pflatten(input_list: list, depth: int = 1) -> list:
     Notice that the list themselves can be made out of any datatypes:
 
     >>> alist = [1, [2.2, True], ['foo', [(1, 4), None]], [3+2j, {'a': 1}]]
-    >>> flatools.flatten(alist, depth=3)
+    >>> flatools.pflatten(alist, depth=3)
     [1, 2.2, True, 'foo', (1, 4), None, 3+2j, {'a': 1}]
+
+    The list is traversed only once regardless of the value of depth, and a
+    depth smaller than 1 returns a shallow copy of the input list:
+
+    >>> alist = [1, 2, [3, [4, 5]]]
+    >>> flatools.pflatten(alist, depth=0)
+    [1, 2, [3, [4, 5]]]
+
+    Just like flatools.flatten(), it takes an optional keyword argument 'types'
+    with the types of the containers to be flattened:
+
+    >>> alist = [1, (2, (3, [4])), [5]]
+    >>> flatools.pflatten(alist, depth=2, types=(list, tuple))
+    [1, 2, 3, [4], 5]
     """
-    if not isinstance(input_list, list):
-        raise TypeError('\'input_list\' must be \'list\'')
     if not isinstance(depth, int):
         raise TypeError('\'depth\' must be \'int\'')
-    aux_list = input_list[:]
-    for _ in range(depth):
-        output_list = []
-        for element in aux_list:
-            if not isinstance(element, list):
-                output_list.append(element)
+    types = _resolve_types(types)
+    if types != (list, ):
+        if not isinstance(input_list, types):
+            raise TypeError('\'input_list\' must be an instance of \'types\'')
+        return _pflatten_types_aux(input_list, depth, [], types)
+    if not isinstance(input_list, list):
+        raise TypeError('\'input_list\' must be \'list\'')
+    return _pflatten_aux(input_list, depth, [])
+
+
+def _pflatten_aux(input_list: list, depth: int, output_list: list) -> list:
+    r"""Appends the elements of input_list to output_list, expanding nested
+    sublists down to the given depth in a single traversal. As in
+    flatools.flatten(), the iterators of the lists being traversed are kept in
+    an explicit stack. Sublists found at the last level are extended at once,
+    and nothing deeper than the actual nesting of input_list is ever visited.
+    """
+    if depth < 1:
+        output_list += input_list
+        return output_list
+    append = output_list.append
+    last_level = depth - 1
+    stack = []
+    iterator = iter(input_list)
+    while True:
+        for element in iterator:
+            if isinstance(element, list):
+                if len(stack) < last_level:
+                    stack.append(iterator)
+                    iterator = iter(element)
+                    break
+                output_list += element
             else:
+                append(element)
+        else:
+            if not stack:
+                return output_list
+            iterator = stack.pop()
+
+
+def _pflatten_types_aux(input_list,
+                        depth: int,
+                        output_list: list,
+                        types: tuple,
+                        ) -> list:
+    r"""Same as _pflatten_aux(), but descending into instances of any of the
+    given container types, looked up in a dispatch table by their exact type.
+    """
+    if depth < 1:
+        output_list += input_list
+        return output_list
+    append = output_list.append
+    dispatch = _dispatch_table(types)
+    last_level = depth - 1
+    stack = []
+    iterator = iter(input_list)
+    while True:
+        for element in iterator:
+            is_container = dispatch.get(type(element))
+            if is_container is None:
+                is_container = _is_container(dispatch, type(element), types)
+            if is_container:
+                if len(stack) < last_level:
+                    stack.append(iterator)
+                    iterator = iter(element)
+                    break
                 output_list += element
-        aux_list = output_list[:]
-    return output_list
+            else:
+                append(element)
+        else:
+            if not stack:
+                return output_list
+            iterator = stack.pop()
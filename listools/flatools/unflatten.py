@@ -0,0 +1,57 @@
+from itertools import islice as _islice
+from .flat_shape import FlatShape, _OPEN
+
+
+def unflatten(flat_values, shape) -> list:
+    r"""flatools.unflatten(flat_values, shape)
+
+    Inverse of flatools.flatten_with_shape(). Nests the elements of the
+    iterable flat_values according to shape, which is either a
+    flatools.FlatShape or a template list whose structure is to be copied.
+    Usage:
+
+    >>> alist = [1, [2, [3, 4]], [5]]
+    >>> flat, shape = flatools.flatten_with_shape(alist)
+    >>> flatools.unflatten(['a', 'b', 'c', 'd', 'e'], shape)
+    ['a', ['b', ['c', 'd']], ['e']]
+
+    >>> flatools.unflatten(range(4), [[None, None], [[None], None]])
+    [[0, 1], [[2], 3]]
+
+    The nested list is rebuilt in a single pass over the instructions stored in
+    the shape, consuming runs of consecutive elements of flat_values at a time.
+    A ValueError is raised if flat_values does not have exactly shape.size
+    elements:
+
+    >>> flatools.unflatten([1, 2], shape)
+    Traceback (most recent call last):
+       ...
+    ValueError: 'flat_values' must have 5 elements
+    """
+    if isinstance(shape, list):
+        shape = FlatShape(shape)
+    elif not isinstance(shape, FlatShape):
+        raise TypeError('\'shape\' must be \'FlatShape\' or \'list\'')
+    try:
+        iterator = iter(flat_values)
+    except TypeError:
+        raise TypeError('\'flat_values\' must be an iterable') from None
+    error = ValueError('\'flat_values\' must have {} elements'.format(
+        shape.size))
+    output_list = node = []
+    stack = []
+    for code in shape._codes:
+        if code > 0:
+            length = len(node)
+            node += _islice(iterator, code)
+            if len(node) - length != code:
+                raise error
+        elif code == _OPEN:
+            stack.append(node)
+            node = []
+            stack[-1].append(node)
+        else:
+            node = stack.pop()
+    for _ in iterator:
+        raise error
+    return output_list
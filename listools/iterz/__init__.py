@@ -9,6 +9,8 @@ This library is published under the MIT License.
 """
 
 from .cycle_until_index import cycle_until_index
+from .cyclic_iterator import CyclicIterator
+from .cyclic_view import CyclicView
 from .inf_cycle import inf_cycle
 from .iter_mask import iter_mask
 from .ncycle import ncycle
@@ -0,0 +1,127 @@
+r"""Private helpers shared by the functions of iterz which accept both
+sequences and unsized iterables (generators, files, database cursors, etc.).
+Sequences are cycled by iterating over them again, without any copy, while
+unsized iterables can only be iterated over once, so their elements are
+buffered during the first pass when a later cycle needs them.
+"""
+
+from collections.abc import Iterator as _Iterator
+from collections.abc import Sized as _Sized
+from itertools import chain as _chain
+from itertools import islice as _islice
+from itertools import repeat as _repeat
+from sys import maxsize as _maxsize
+
+
+def is_sequence(input_iter) -> bool:
+    r"""Returns True if input_iter has a length and can be iterated over more
+    than once, and thus does not need to be buffered to be cycled.
+    """
+    return isinstance(input_iter, _Sized) and not isinstance(input_iter,
+                                                              _Iterator)
+
+
+def peek(iterator) -> tuple:
+    r"""Returns a tuple (is_empty, iterator), where the returned iterator
+    yields the same elements as the given one, including the one consumed to
+    check whether it is empty.
+    """
+    for first in iterator:
+        return False, _chain((first, ), iterator)
+    return True, iterator
+
+
+def nonempty_iterables(input_iters: tuple) -> list:
+    r"""Returns the list of input_iters in which unsized iterables are
+    replaced by iterators over the same elements. Raises an IndexError if any
+    of them is empty.
+    """
+    error = IndexError('all elements of \'*input_iters\' must have len > 0')
+    iterables = []
+    for input_iter in input_iters:
+        if is_sequence(input_iter):
+            if len(input_iter) == 0:
+                raise error
+            iterables.append(input_iter)
+        else:
+            is_empty, iterator = peek(iter(input_iter))
+            if is_empty:
+                raise error
+            iterables.append(iterator)
+    return iterables
+
+
+def long_islice(iterator, n: int):
+    r"""Same as itertools.islice(iterator, n), but also accepting values of n
+    larger than sys.maxsize, which islice() does not. Those are split into
+    consecutive islices of at most sys.maxsize elements.
+    """
+    if n <= _maxsize:
+        return _islice(iterator, n)
+    return _chain.from_iterable(map(_islice, _repeat(iterator), _counts(n)))
+
+
+def long_repeat(obj, n: int):
+    r"""Same as itertools.repeat(obj, n), but also accepting values of n
+    larger than sys.maxsize, as long_islice() does.
+    """
+    if n <= _maxsize:
+        return _repeat(obj, n)
+    return _chain.from_iterable(map(_repeat, _repeat(obj), _counts(n)))
+
+
+def _counts(n: int):
+    r"""Generator splitting n into counts of at most sys.maxsize."""
+    while n > _maxsize:
+        yield _maxsize
+        n -= _maxsize
+    yield n
+
+
+def cycle_sequence(input_iter, n: int = None):
+    r"""Returns an iterator cycling the sequence input_iter n times, or
+    indefinitely if n is None.
+    """
+    if n is None:
+        return _chain.from_iterable(_repeat(input_iter))
+    return _chain.from_iterable(long_repeat(input_iter, n))
+
+
+def cycle_from(sequence, offset: int):
+    r"""Returns an iterator cycling the sequence indefinitely, starting at the
+    element at position offset. The first, partial cycle is indexed so that
+    starting in the middle of the sequence does not iterate over its head.
+    """
+    cycler = _chain.from_iterable(_repeat(sequence))
+    offset %= len(sequence)
+    if offset:
+        cycler = _chain(map(sequence.__getitem__,
+                            range(offset, len(sequence))),
+                        cycler)
+    return cycler
+
+
+def cycle_stream(iterator, n: int = None, on_exhausted=None):
+    r"""Generator cycling the elements of iterator n times, or indefinitely if
+    n is None. The first pass is streamed while its elements are stored in a
+    buffer, which is then cycled. Nothing is buffered when only one pass is
+    needed. When the first pass is over, on_exhausted (if given) is called
+    with the number of elements of iterator.
+    """
+    if n is not None and n <= 1:
+        if n == 1:
+            yield from iterator
+        return
+    buffer = []
+    append = buffer.append
+    for element in iterator:
+        append(element)
+        yield element
+    if on_exhausted is not None:
+        on_exhausted(len(buffer))
+    if not buffer:
+        return
+    if n is None:
+        yield from _chain.from_iterable(_repeat(buffer))
+    else:
+        yield from _chain.from_iterable(long_repeat(buffer, n - 1))
@@ -1,5 +1,12 @@
-def cycle_until_index(input_iter, i: int):
-    r"""iterz.cycle_until_index(input_iter, i)
+from itertools import islice as _islice
+from ._utils import is_sequence as _is_sequence
+from ._utils import long_islice as _long_islice
+from .cyclic_view import CyclicView as _CyclicView
+from .cyclic_view import _check_sequences
+
+
+def cycle_until_index(input_iter, i: int, *, view: bool = False):
+    r"""iterz.cycle_until_index(input_iter, i[, *, view])
 
     This will cycle an iterator up to a certain index (inclusive). Usage:
 
@@ -21,14 +28,51 @@ def cycle_until_index(input_iter, i: int):
     foo
     3.0
     3+2j
+
+    Unsized iterables such as generators or files are also accepted, and are
+    consumed only up to the index (in which case negative indices other than
+    -1 raise a ValueError, since their length is unknown):
+
+    >>> list(iterz.cycle_until_index((x ** 2 for x in range(10)), 2))
+    [0, 1, 4]
+
+    Setting the optional keyword argument 'view' to True returns instead a
+    read-only iterz.CyclicView, supporting len(), indexing, slicing and
+    reversing in constant time:
+
+    >>> view = iterz.cycle_until_index([1, 2, 4, 8, 16, 32], 4, view=True)
+    >>> len(view), view[-1]
+    (5, 16)
     """
+    if not isinstance(view, bool):
+        raise TypeError('\'view\' must be \'bool\'')
+    if view:
+        if not isinstance(i, int):
+            raise TypeError('\'i\' must be \'int\'')
+        _check_sequences((input_iter, ))
+        return _CyclicView((input_iter, ),
+                           range(len(input_iter))[: i + 1],
+                           False)
+    return _cycle_until_index(input_iter, i)
+
+
+def _cycle_until_index(input_iter, i: int):
+    r"""Generator implementing cycle_until_index() without 'view'."""
     try:
         iterator = iter(input_iter)
     except:
         raise TypeError('\'input_iter\' must be \'iter\'')
     if not isinstance(i, int):
         raise TypeError('\'i\' must be \'int\'')
+    if not _is_sequence(input_iter):
+        if i < -1:
+            raise ValueError('\'i\' must not be smaller than -1 when '
+                             '\'input_iter\' is unsized')
+        yield from _long_islice(iterator, i + 1)
+        return
     if len(input_iter) < 1:
         return
-    for item in input_iter[: i + 1]:
-        yield item
+    if i < -1:
+        yield from input_iter[: i + 1]
+        return
+    yield from _islice(input_iter, min(i + 1, len(input_iter)))
@@ -0,0 +1,146 @@
+from collections.abc import Mapping as _Mapping
+from itertools import islice as _islice
+from itertools import repeat as _repeat
+from ._utils import cycle_from as _cycle_from
+
+
+class CyclicIterator:
+    r"""iterz.CyclicIterator
+
+    Infinite iterator returned by iterz.inf_cycle() and iterz.zip_inf_cycle()
+    when called with the keyword argument 'seekable' set to True. Besides
+    being iterated over, it can jump to any position of the cycle in constant
+    time, report how many elements it has yielded so far, and be pickled to be
+    resumed later. Usage:
+
+    >>> cycled = iterz.inf_cycle([1, 2, 4, 8], seekable=True)
+    >>> cycled.__next__(), cycled.__next__()
+    (1, 2)
+    >>> cycled.position
+    2
+    >>> cycled.advance(10 ** 9)
+    >>> cycled.position
+    1000000002
+    >>> cycled.__next__()
+    4
+    >>> cycled.seek(3)
+    >>> cycled.__next__()
+    8
+
+    Its state is just the input sequences and the position, so that pickling
+    it stores no iteration state but the position:
+
+    >>> import pickle
+    >>> restored = pickle.loads(pickle.dumps(cycled))
+    >>> restored.position, restored.__next__()
+    (4, 1)
+
+    When iterz.inf_cycle() is given an unsized iterable (such as a generator),
+    its elements are buffered during the first pass. Until that pass is over,
+    seeking forward reads the iterable up to the requested position, and the
+    iterator can only be pickled if the iterable itself can.
+    """
+
+    __slots__ = ('_sequences', '_zipped', '_position', '_stream', '_next')
+
+    def __init__(self, sequences: tuple, zipped: bool, stream=None) -> None:
+        self._sequences = sequences
+        self._zipped = zipped
+        self._position = 0
+        self._stream = stream
+        self._next = self._restart
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        item = self._next()
+        self._position += 1
+        return item
+
+    def __getstate__(self) -> tuple:
+        return self._sequences, self._zipped, self._position, self._stream
+
+    def __setstate__(self, state: tuple) -> None:
+        self._sequences, self._zipped, self._position, self._stream = state
+        self._next = self._restart
+
+    def __repr__(self) -> str:
+        return 'CyclicIterator(position={!r})'.format(self._position)
+
+    @property
+    def position(self) -> int:
+        r"""Number of elements yielded since the start of the cycle, that is,
+        the index in the cycle of the next element to be yielded.
+        """
+        return self._position
+
+    def advance(self, n: int) -> None:
+        r"""Skips the next n elements without computing them."""
+        if not isinstance(n, int):
+            raise TypeError('\'n\' must be \'int\'')
+        self.seek(self._position + n)
+
+    def seek(self, i: int) -> None:
+        r"""Moves to the position i of the cycle, so that the next element to
+        be yielded is the one at index i.
+        """
+        if not isinstance(i, int):
+            raise TypeError('\'i\' must be \'int\'')
+        if i < 0:
+            raise ValueError('the position must not be negative')
+        if self._stream is not None:
+            buffer = self._sequences[0]
+            if i > len(buffer):
+                buffer += _islice(self._stream, i - len(buffer))
+                if i > len(buffer):
+                    self._stream = None
+        self._position = i
+        self._next = self._restart
+
+    def _restart(self):
+        r"""Returns the element at the current position, and sets _next() to
+        an itertools iterator over the following ones, so that __next__() does
+        not need to check its state on every call. Called on the first
+        __next__() after the iterator is created, seeks or is unpickled.
+        """
+        if self._stream is not None:
+            self._next = self._next_from_stream
+            return self._next_from_stream()
+        if not self._sequences:
+            self._next = _repeat(()).__next__
+            return ()
+        if not all(map(len, self._sequences)):
+            raise StopIteration
+        cyclers = [_cycle_from(sequence, self._position)
+                   for sequence in self._sequences]
+        if self._zipped:
+            self._next = zip(*cyclers).__next__
+        else:
+            self._next = cyclers[0].__next__
+        return self._next()
+
+    def _next_from_stream(self):
+        r"""Returns the element at the current position while the first pass
+        over an unsized iterable is not over, reading it from the iterable and
+        appending it to the buffer if needed.
+        """
+        buffer = self._sequences[0]
+        if self._position < len(buffer):
+            return buffer[self._position]
+        for item in self._stream:
+            buffer.append(item)
+            return item
+        self._stream = None
+        return self._restart()
+
+
+def _indexable(input_iter):
+    r"""Returns input_iter if its elements can be accessed by position, or a
+    tuple with its elements otherwise (e.g. for sets and mappings, the latter
+    being iterated over by key).
+    """
+    if (not hasattr(type(input_iter), '__getitem__')
+            or isinstance(input_iter, _Mapping)):
+        return tuple(input_iter)
+    return input_iter
@@ -0,0 +1,148 @@
+from collections.abc import Mapping as _Mapping
+from collections.abc import Sequence as _Sequence
+from ..listutils import list_lcm as _list_lcm
+from ._utils import cycle_from as _cycle_from
+from ._utils import is_sequence as _is_sequence
+from ._utils import long_islice as _long_islice
+
+
+class CyclicView(_Sequence):
+    r"""iterz.CyclicView
+
+    Read-only sequence returned by iterz.ncycle(), iterz.zip_cycle(),
+    iterz.zip_syzygy() and iterz.cycle_until_index() when called with the
+    keyword argument 'view' set to True. It contains the same elements that
+    these functions would otherwise yield, without computing them in advance.
+    Usage:
+
+    >>> cycled = iterz.ncycle([1, 2, 4, 8], 3, view=True)
+    >>> len(cycled)
+    12
+    >>> cycled[5]
+    2
+    >>> cycled[-1]
+    8
+    >>> list(cycled[2:7])
+    [4, 8, 1, 2, 4]
+    >>> list(reversed(cycled[:4]))
+    [8, 4, 2, 1]
+
+    Every element is computed arithmetically from its index, so that len()
+    and indexing take constant time regardless of the number of cycles, and
+    slicing returns another view in constant time:
+
+    >>> zipped = iterz.zip_cycle([1, 2], 'abc', view=True)
+    >>> zipped[1]
+    (2, 'b')
+    >>> huge = iterz.ncycle([1, 2, 3], 10 ** 12, view=True)
+    >>> huge[10 ** 9]
+    2
+
+    The number of elements after which the cycle repeats itself is given by
+    the attribute period, which is the least common multiple of the lengths of
+    the input sequences. The method chunks() splits a view into consecutive
+    views of a given size, so that a long cycle can be shared among workers by
+    offset ranges. Iterating over a view (or over a slice of it) starts
+    directly at its first index, without walking over the previous elements:
+
+    >>> zipped = iterz.zip_syzygy(range(997), range(991), range(983),
+    ...                           view=True)
+    >>> zipped.period
+    971230541
+    >>> [len(chunk) for chunk in zipped[:10 ** 6].chunks(300000)]
+    [300000, 300000, 300000, 100000]
+    >>> next(iter(zipped[900000000:]))
+    (124, 557, 588)
+
+    The input sequences are not copied, so they must not be modified while
+    the view is in use.
+    """
+
+    __slots__ = ('_sequences', '_indices', '_zipped')
+
+    def __init__(self, sequences: tuple, indices: range, zipped: bool) -> None:
+        self._sequences = sequences
+        self._indices = indices
+        self._zipped = zipped
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __length_hint__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return CyclicView(self._sequences, self._indices[i], self._zipped)
+        if not isinstance(i, int):
+            raise TypeError('\'CyclicView\' indices must be integers or '
+                            'slices')
+        try:
+            index = self._indices[i]
+        except IndexError:
+            raise IndexError('\'CyclicView\' index out of range') from None
+        return self._item(index)
+
+    def __iter__(self):
+        indices = self._indices
+        if indices.step != 1 or not indices:
+            return map(self._item, indices)
+        cyclers = [_cycle_from(sequence, indices.start)
+                   for sequence in self._sequences]
+        if self._zipped:
+            cycled = zip(*cyclers)
+        else:
+            cycled = cyclers[0]
+        return _long_islice(cycled, indices.stop - indices.start)
+
+    def __reversed__(self):
+        return map(self._item, reversed(self._indices))
+
+    def __repr__(self) -> str:
+        indices = self._indices
+        if not indices:
+            return 'CyclicView(length=0)'
+        length = (indices[-1] - indices.start) // indices.step + 1
+        return 'CyclicView(length={!r})'.format(length)
+
+    @property
+    def period(self) -> int:
+        r"""Number of elements after which the cycle repeats itself."""
+        return _list_lcm([len(sequence) for sequence in self._sequences])
+
+    def chunks(self, size: int):
+        r"""Generator which yields consecutive views of 'size' elements (the
+        last one may be shorter) covering the whole view, each of them
+        created in constant time.
+        """
+        if not isinstance(size, int):
+            raise TypeError('\'size\' must be \'int\'')
+        if size < 1:
+            raise ValueError('\'size\' must be a positive \'int\'')
+        indices = self._indices
+        for start in range(indices.start, indices.stop, size * indices.step):
+            yield CyclicView(self._sequences,
+                             range(start, indices.stop, indices.step)[:size],
+                             self._zipped)
+
+    def _item(self, index: int):
+        r"""Returns the element at the position index of the cycle."""
+        if self._zipped:
+            return tuple([sequence[index % len(sequence)]
+                          for sequence in self._sequences])
+        sequence = self._sequences[0]
+        return sequence[index % len(sequence)]
+
+
+def _check_sequences(input_iters: tuple) -> None:
+    r"""Raises a TypeError unless all of input_iters are sequences which can
+    be indexed by position, as required by CyclicView. Mappings are rejected
+    since they are iterated over by key.
+    """
+    for input_iter in input_iters:
+        if (not (_is_sequence(input_iter)
+                 and hasattr(type(input_iter), '__getitem__'))
+                or isinstance(input_iter, _Mapping)):
+            raise TypeError('all inputs must be sequences when \'view\' is '
+                            'True')
+
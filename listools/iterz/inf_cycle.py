@@ -1,8 +1,12 @@
-from itertools import count as _count
+from ._utils import cycle_sequence as _cycle_sequence
+from ._utils import cycle_stream as _cycle_stream
+from ._utils import is_sequence as _is_sequence
+from .cyclic_iterator import CyclicIterator as _CyclicIterator
+from .cyclic_iterator import _indexable
 
 
-def inf_cycle(input_iter):
-    r"""iterz.inf_cycle(input_iter)
+def inf_cycle(input_iter, *, seekable: bool = False):
+    r"""iterz.inf_cycle(input_iter[, *, seekable])
 
     This will cycle an iterator indefinitely. Usage:
 
@@ -31,12 +35,55 @@ def inf_cycle(input_iter):
     3.0
     1
     foo
+
+    Unsized iterables such as generators or files are also accepted. Their
+    elements are yielded as they are read, and stored so that they can be
+    cycled once the iterable is exhausted:
+
+    >>> inf_cycle_iter = iterz.inf_cycle(x ** 2 for x in range(3))
+    >>> [inf_cycle_iter.__next__() for _ in range(7)]
+    [0, 1, 4, 0, 1, 4, 0]
+
+    Sequences (lists, tuples, strings, etc.) are iterated over again on each
+    cycle and are never copied.
+
+    Setting the optional keyword argument 'seekable' to True returns instead
+    an iterz.CyclicIterator, which can also skip ahead or move to any position
+    of the cycle in constant time, and can be pickled to be resumed later:
+
+    >>> inf_cycle_iter = iterz.inf_cycle([1, 2, 4, 8], seekable=True)
+    >>> inf_cycle_iter.advance(10 ** 9 + 1)
+    >>> inf_cycle_iter.__next__()
+    2
+    >>> inf_cycle_iter.position
+    1000000002
+
+    Its elements take longer to be yielded than those of the default
+    generator, and its input is checked as soon as it is created, instead of
+    when the first element is requested.
     """
+    if not isinstance(seekable, bool):
+        raise TypeError('\'seekable\' must be \'bool\'')
+    if seekable:
+        try:
+            iterator = iter(input_iter)
+        except:
+            raise TypeError('\'input_iter\' must be \'iter\'')
+        if not _is_sequence(input_iter):
+            return _CyclicIterator(([], ), False, stream=iterator)
+        return _CyclicIterator((_indexable(input_iter), ), False)
+    return _inf_cycle(input_iter)
+
+
+def _inf_cycle(input_iter):
+    r"""Generator implementing inf_cycle() without 'seekable'."""
     try:
         iterator = iter(input_iter)
     except:
         raise TypeError('\'input_iter\' must be \'iter\'')
+    if not _is_sequence(input_iter):
+        yield from _cycle_stream(iterator)
+        return
     if len(input_iter) < 1:
         return
-    for i in _count():
-        yield input_iter[i % len(input_iter)]
+    yield from _cycle_sequence(input_iter)
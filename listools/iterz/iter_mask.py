@@ -1,4 +1,10 @@
-from .zip_cycle import zip_cycle
+from itertools import chain as _chain
+from itertools import compress as _compress
+from itertools import islice as _islice
+from ._utils import cycle_sequence as _cycle_sequence
+from ._utils import is_sequence as _is_sequence
+
+
 def iter_mask(input_iter, mask: list):
     r"""iterz.iter_mask(input_iter, mask)
 
@@ -43,6 +49,22 @@ def iter_mask(input_iter, mask: list):
     'foo'
     None
     3+2j
+
+    If the mask is longer than the input iterator, it is the input iterator
+    which loops, until the end of the mask:
+
+    >>> alist = [1, 2]
+    >>> mask = [1, 0, 1, 1]
+    >>> for item in iterz.iter_mask(alist, mask):
+    ...     print(item)
+    1
+    1
+    2
+
+    The input can also be an unsized iterable such as a generator or a file,
+    which is consumed as the values are yielded. Only its first len(mask)
+    elements are stored, to be looped over in case it is shorter than the
+    mask.
     """
     try:
         iterator = iter(input_iter)
@@ -52,8 +74,20 @@ def iter_mask(input_iter, mask: list):
         raise TypeError('\'mask\' must be \'list\'')
     if len(mask) == 0:
         raise IndexError('\'mask\' must have len > 0')
-    if len(input_iter) == 0:
-        return
-    for item, mask_value in zip_cycle(input_iter, mask):
-        if mask_value:
-            yield item
+    if _is_sequence(input_iter):
+        if len(input_iter) == 0:
+            return
+        if len(input_iter) < len(mask):
+            head = input_iter
+        else:
+            yield from _compress(input_iter, _cycle_sequence(mask))
+            return
+    else:
+        head = list(_islice(iterator, len(mask)))
+        if len(head) == len(mask):
+            yield from _compress(_chain(head, iterator),
+                                 _cycle_sequence(mask))
+            return
+        if len(head) == 0:
+            return
+    yield from _compress(_islice(_cycle_sequence(head), len(mask)), mask)
@@ -1,5 +1,12 @@
-def ncycle(input_iter, n: int):
-    r"""iterz.ncycle(input_iter)
+from ._utils import cycle_sequence as _cycle_sequence
+from ._utils import cycle_stream as _cycle_stream
+from ._utils import is_sequence as _is_sequence
+from .cyclic_view import CyclicView as _CyclicView
+from .cyclic_view import _check_sequences
+
+
+def ncycle(input_iter, n: int, *, view: bool = False):
+    r"""iterz.ncycle(input_iter, n[, *, view])
 
     This will cycle an iterator a certain number of times. Usage:
 
@@ -29,14 +36,46 @@ def ncycle(input_iter, n: int):
     1
     foo
     3.0
+
+    Unsized iterables such as generators or files are also accepted. Their
+    first pass is streamed and, unless n is 1, stored to be cycled:
+
+    >>> list(iterz.ncycle((x ** 2 for x in range(3)), 2))
+    [0, 1, 4, 0, 1, 4]
+
+    Setting the optional keyword argument 'view' to True returns instead a
+    read-only iterz.CyclicView, supporting len(), indexing, slicing and
+    reversing in constant time without iterating over the cycles:
+
+    >>> cycled = iterz.ncycle([1, 2, 4, 8], 1000, view=True)
+    >>> len(cycled)
+    4000
+    >>> cycled[2001]
+    2
     """
+    if not isinstance(view, bool):
+        raise TypeError('\'view\' must be \'bool\'')
+    if view:
+        if not isinstance(n, int):
+            raise TypeError('\'n\' must be \'int\'')
+        _check_sequences((input_iter, ))
+        return _CyclicView((input_iter, ),
+                           range(max(n, 0) * len(input_iter)),
+                           False)
+    return _ncycle(input_iter, n)
+
+
+def _ncycle(input_iter, n: int):
+    r"""Generator implementing ncycle() without 'view'."""
     try:
         iterator = iter(input_iter)
     except:
         raise TypeError('\'input_iter\' must be \'iter\'')
     if not isinstance(n, int):
         raise TypeError('\'n\' must be \'int\'')
+    if not _is_sequence(input_iter):
+        yield from _cycle_stream(iterator, n)
+        return
     if len(input_iter) < 1:
         return
-    for i in range(n * len(input_iter)):
-        yield input_iter[i % len(input_iter)]
+    yield from _cycle_sequence(input_iter, n)
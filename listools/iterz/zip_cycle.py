@@ -1,5 +1,15 @@
-def zip_cycle(*input_iters) -> tuple:
-    r"""iterz.zip_cycle(*input_iters)
+from itertools import chain as _chain
+from itertools import islice as _islice
+from itertools import repeat as _repeat
+from ._utils import cycle_stream as _cycle_stream
+from ._utils import is_sequence as _is_sequence
+from ._utils import nonempty_iterables as _nonempty_iterables
+from .cyclic_view import CyclicView as _CyclicView
+from .cyclic_view import _check_sequences
+
+
+def zip_cycle(*input_iters, view: bool = False):
+    r"""iterz.zip_cycle(*input_iters[, view])
 
     Similar to zip but cycles smaller lists or iterables until the longest one
     is output. Usage:
@@ -42,17 +52,95 @@ def zip_cycle(*input_iters) -> tuple:
     2 5.0 e
     3 6.0 a
     1 7.0 b
+
+    Unsized iterables such as generators or files are also accepted. Their
+    elements are stored as they are read, so that they can be cycled if they
+    turn out not to be the longest input. Elements stop being stored once an
+    unsized iterable is known to be the longest input:
+
+    >>> for i, j in iterz.zip_cycle((x ** 2 for x in range(2)), 'abcde'):
+    ...     print(i, j)
+    0 a
+    1 b
+    0 c
+    1 d
+    0 e
+
+    Setting the optional keyword argument 'view' to True returns instead a
+    read-only iterz.CyclicView of the tuples, supporting len(), indexing,
+    slicing and reversing in constant time:
+
+    >>> zipped = iterz.zip_cycle([1, 2], 'abcde', view=True)
+    >>> len(zipped)
+    5
+    >>> zipped[-1]
+    (1, 'e')
     """
+    if not isinstance(view, bool):
+        raise TypeError('\'view\' must be \'bool\'')
+    if view:
+        _check_sequences(input_iters)
+        if any(len(input_iter) == 0 for input_iter in input_iters):
+            raise IndexError('all elements of \'*input_iters\' must have '
+                             'len > 0')
+        return _CyclicView(input_iters,
+                           range(max(map(len, input_iters))),
+                           True)
+    return _zip_cycle(*input_iters)
+
+
+def _zip_cycle(*input_iters):
+    r"""Generator implementing zip_cycle() without 'view'."""
     for input_iter in input_iters:
         try:
             iterator = iter(input_iter)
         except:
             raise TypeError('\'*input_iters\' must be one or more \'iter\'')
-    if any(len(input_iter) == 0 for input_iter in input_iters):
-        raise IndexError('all elements of \'*input_iters\' must have len > 0')
-    max_length = max([len(input_iter) for input_iter in input_iters])
-    for i in range(max_length):
-        output_list = []
-        for input_iter in input_iters:
-            output_list.append(input_iter[i % len(input_iter)])
-        yield tuple(output_list)
+    iterables = _nonempty_iterables(input_iters)
+    if all(map(_is_sequence, iterables)):
+        max_length = max(map(len, iterables))
+        yield from _islice(zip(*[_chain.from_iterable(_repeat(input_iter))
+                                 for input_iter in iterables]),
+                           max_length)
+        return
+    yield from _zip_cycle_streams(iterables)
+
+
+def _zip_cycle_streams(iterables: list) -> tuple:
+    r"""Same as zip_cycle(), for iterables of which at least one is unsized.
+    The unsized ones are streamed and buffered by _cycle_stream(), which
+    reports the length of each of them once its first pass is over. The
+    output stops when all of them are exhausted and the longest sequence has
+    been output. Once a single unsized iterable is still being read and the
+    longest sequence has been output, that iterable is the longest input and
+    will never be cycled, so it is read directly and its buffer is released.
+    """
+    max_length = max([len(iterable) for iterable in iterables
+                      if _is_sequence(iterable)] or [0])
+    running = []
+    cyclers = []
+    for j, iterable in enumerate(iterables):
+        if _is_sequence(iterable):
+            cyclers.append(_chain.from_iterable(_repeat(iterable)))
+        else:
+            cyclers.append(_cycle_stream(
+                iterable,
+                on_exhausted=lambda length, j=j: running.remove(j)
+            ))
+            running.append(j)
+    zipped = zip(*cyclers)
+    count = 0
+    for items in zipped:
+        if not running:
+            if count < max_length:
+                yield items
+                yield from _islice(zipped, max_length - count - 1)
+            return
+        yield items
+        count += 1
+        if count >= max_length and len(running) == 1:
+            break
+    last = running[0]
+    cyclers[last] = iterables[last]
+    del zipped
+    yield from zip(*cyclers)
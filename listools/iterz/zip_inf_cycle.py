@@ -1,8 +1,11 @@
-from itertools import count as _count
+from itertools import chain as _chain
+from itertools import repeat as _repeat
+from .cyclic_iterator import CyclicIterator as _CyclicIterator
+from .cyclic_iterator import _indexable
 
 
-def zip_inf_cycle(*input_iters) -> tuple:
-    r"""iterz.zip_inf_cycle(*input_iters)
+def zip_inf_cycle(*input_iters, seekable: bool = False):
+    r"""iterz.zip_inf_cycle(*input_iters[, seekable])
 
     Similar to zip but cycles all lists indefinitely. Usage:
 
@@ -56,6 +59,41 @@ def zip_inf_cycle(*input_iters) -> tuple:
     2 1.0 c
     3 2.0 d
     1 3.0 e
+
+    Setting the optional keyword argument 'seekable' to True returns instead
+    an iterz.CyclicIterator, which can also skip ahead or move to any position
+    of the cycle in constant time, and can be pickled to be resumed later:
+
+    >>> zip_inf_cycle_iter = iterz.zip_inf_cycle(a, b, c, seekable=True)
+    >>> zip_inf_cycle_iter.seek(10 ** 9)
+    >>> zip_inf_cycle_iter.__next__()
+    (2, 7.0, 'a')
+
+    Its elements take longer to be yielded than those of the default
+    generator, and its inputs are checked as soon as it is created, instead of
+    when the first element is requested.
+    """
+    if not isinstance(seekable, bool):
+        raise TypeError('\'seekable\' must be \'bool\'')
+    if seekable:
+        _check_inputs(input_iters)
+        return _CyclicIterator(tuple(map(_indexable, input_iters)), True)
+    return _zip_inf_cycle(*input_iters)
+
+
+def _zip_inf_cycle(*input_iters):
+    r"""Generator implementing zip_inf_cycle() without 'seekable'."""
+    _check_inputs(input_iters)
+    if not input_iters:
+        yield from _repeat(())
+        return
+    yield from zip(*[_chain.from_iterable(_repeat(input_iter))
+                     for input_iter in input_iters])
+
+
+def _check_inputs(input_iters: tuple) -> None:
+    r"""Raises a TypeError or an IndexError unless all of input_iters are
+    iterables with len > 0.
     """
     for input_iter in input_iters:
         try:
@@ -64,8 +102,3 @@ def zip_inf_cycle(*input_iters) -> tuple:
             raise TypeError('\'*input_iters\' must be one or more \'iter\'')
     if any(len(input_iter) == 0 for input_iter in input_iters):
         raise IndexError('all elements of \'*input_iters\' must have len > 0')
-    for i in _count():
-        output_list = []
-        for input_iter in input_iters:
-            output_list.append(input_iter[i % len(input_iter)])
-        yield tuple(output_list)
@@ -1,3 +1,7 @@
+from itertools import zip_longest as _zip_longest
+from ._utils import nonempty_iterables as _nonempty_iterables
+
+
 def zip_longest(*input_iters, default=None) -> tuple:
     r"""iterz.zip_longest(*input_iters[, default])
 
@@ -57,20 +61,16 @@ def zip_longest(*input_iters, default=None) -> tuple:
     0 4 4
     0 0 5
     0 0 6
+
+    Unsized iterables such as generators or files are also accepted, and are
+    consumed as the tuples are yielded, without being stored.
     """
     for input_iter in input_iters:
         try:
             iterator = iter(input_iter)
         except:
             raise TypeError('\'*input_iters\' must be one or more \'iter\'')
-    if any(len(input_iter) == 0 for input_iter in input_iters):
-        raise IndexError('all elements of \'*input_iters\' must have len > 0')
-    max_length = max([len(input_iter) for input_iter in input_iters])
-    for i in range(max_length):
-        output_list = []
-        for input_iter in input_iters:
-            if i < len(input_iter):
-                output_list.append(input_iter[i])
-            else:
-                output_list.append(default)
-        yield tuple(output_list)
+    if not input_iters:
+        raise ValueError('\'*input_iters\' must be one or more \'iter\'')
+    iterables = _nonempty_iterables(input_iters)
+    yield from _zip_longest(*iterables, fillvalue=default)
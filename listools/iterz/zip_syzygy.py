@@ -1,8 +1,13 @@
+from itertools import chain as _chain
+from itertools import islice as _islice
+from itertools import repeat as _repeat
 from ..listutils import list_lcm as _list_lcm
+from .cyclic_view import CyclicView as _CyclicView
+from .cyclic_view import _check_sequences
 
 
-def zip_syzygy(*input_iters) -> tuple:
-    r"""iterz.zip_syzygy(*input_iters)
+def zip_syzygy(*input_iters, view: bool = False):
+    r"""iterz.zip_syzygy(*input_iters[, view])
 
     Similar to zip but cycles lists until all of them are exhausted at the same
     time (that is, when the next output tuple would be the same as the very
@@ -57,7 +62,32 @@ def zip_syzygy(*input_iters) -> tuple:
     2 1.0 a
     1 2.0 b
     2 3.0 c
+
+    Setting the optional keyword argument 'view' to True returns instead a
+    read-only iterz.CyclicView of the tuples, supporting len(), indexing,
+    slicing and reversing in constant time, which is useful when the least
+    common multiple of the lengths of the inputs is large:
+
+    >>> zipped = iterz.zip_syzygy(range(997), range(991), view=True)
+    >>> len(zipped)
+    988027
+    >>> zipped[500000]
+    (503, 536)
     """
+    if not isinstance(view, bool):
+        raise TypeError('\'view\' must be \'bool\'')
+    if view:
+        _check_sequences(input_iters)
+        if any(len(input_iter) == 0 for input_iter in input_iters):
+            raise IndexError('all elements of \'*input_iters\' must have '
+                             'len > 0')
+        lcm = _list_lcm([len(input_iter) for input_iter in input_iters])
+        return _CyclicView(input_iters, range(lcm), True)
+    return _zip_syzygy(*input_iters)
+
+
+def _zip_syzygy(*input_iters):
+    r"""Generator implementing zip_syzygy() without 'view'."""
     for input_iter in input_iters:
         try:
             iterator = iter(input_iter)
@@ -66,8 +96,6 @@ def zip_syzygy(*input_iters) -> tuple:
     if any(len(input_iter) == 0 for input_iter in input_iters):
         raise IndexError('all elements of \'*input_iters\' must have len > 0')
     lcm = _list_lcm([len(input_iter) for input_iter in input_iters])
-    for i in range(lcm):
-        output_list = []
-        for input_iter in input_iters:
-            output_list.append(input_iter[i % len(input_iter)])
-        yield tuple(output_list)
+    yield from _islice(zip(*[_chain.from_iterable(_repeat(input_iter))
+                             for input_iter in input_iters]),
+                       lcm)
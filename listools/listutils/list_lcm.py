@@ -8,7 +8,7 @@ def _lcm(i: int, j: int) -> int:
     """
     if (i, j) == (0, 0):
         return 0
-    return int(i * j / _gcd(i, j))
+    return i * j // _gcd(i, j)
 
 
 def list_lcm(input_list: List[int]) -> int:
@@ -1,3 +1,7 @@
+from .._numpy import is_ndarray as _is_ndarray
+from .._types import count_types as _count_types
+
+
 def mixed_type(input_list: list) -> bool:
     r"""llogic.mixed_type(input_list)
 
@@ -28,7 +32,17 @@ def mixed_type(input_list: list) -> bool:
     >>> alist = []
     >>> llogic.single_type(alist)
     False
+
+    The list is scanned only until an element of a different type is found.
+    If NumPy is installed, the input can also be a NumPy array, in which case
+    its dtype is used to answer without scanning its elements, unless it is a
+    one-dimensional array of dtype object.
     """
-    if not isinstance(input_list, list):
+    if _is_ndarray(input_list):
+        if input_list.ndim == 0:
+            raise TypeError('\'input_list\' must be \'list\'')
+        if input_list.ndim > 1 or input_list.dtype.kind != 'O':
+            return False
+    elif not isinstance(input_list, list):
         raise TypeError('\'input_list\' must be \'list\'')
-    return len(set(map(type, input_list))) > 1
+    return _count_types(input_list) > 1
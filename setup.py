@@ -57,6 +57,7 @@ setup(
     license='MIT',
     long_description=listools_long_description,
     tests_require=['pytest'],
+    extras_require={'numpy': ['numpy']},
     classifiers=listools_classifiers,
     python_requires='>=3.5',
 )
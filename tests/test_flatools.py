@@ -17,6 +17,11 @@ def test_flatten():
 
     assert flatools.flatten([]) == []
 
+    alist = [1]
+    for _ in range(100000):
+        alist = [alist, 2]
+    assert flatools.flatten(alist) == [1] + [2] * 100000
+
 
 def test_pflatten():
     alist = [[1, 2], [3, 4], [5], [6, 7, 8], [9, 10]]
@@ -34,6 +39,10 @@ def test_pflatten():
 
     assert flatools.pflatten([]) == []
 
+    alist = [1, 2, [3, [4, 5]]]
+    assert flatools.pflatten(alist, depth=0) == [1, 2, [3, [4, 5]]]
+    assert flatools.pflatten(alist, depth=1000) == [1, 2, 3, 4, 5]
+
 
 def test_flatten_join():
     alist = [[1, 2], [3, 4]]
@@ -81,6 +90,29 @@ def test_flatten_sum():
     alist = []
     assert flatools.flatten_sum(alist) == 0
 
+    alist = [[0.1] * 5, [0.1] * 5]
+    assert flatools.flatten_sum(alist, mode='exact') == 1.0
+    assert flatools.flatten_sum(alist, start=1, mode='exact') == 2.0
+    assert flatools.flatten_sum(alist, mode='pairwise') == pytest.approx(1.0)
+
+    alist = [1, [2, [3, 4], 5], 6]
+    assert flatools.flatten_sum(alist, mode='int') == 21
+    assert flatools.flatten_sum(alist, start=4, mode='int') == 25
+    assert flatools.flatten_sum(alist, mode='pairwise') == 21
+    assert flatools.flatten_sum([], mode='int') == 0
+    assert flatools.flatten_sum([], mode='pairwise') == 0
+    assert flatools.flatten_sum([[]], mode='exact') == 0.0
+
+    alist = [[i, [i + 0.5]] for i in range(3000)]
+    expected_result = sum(flatools.flatten(alist))
+    assert flatools.flatten_sum(alist, mode='pairwise') == expected_result
+    assert flatools.flatten_sum(alist, mode='exact') == expected_result
+
+    with pytest.raises(TypeError):
+        flatools.flatten_sum([1, [2, 3.0]], mode='int')
+    with pytest.raises(ValueError):
+        flatools.flatten_sum([1, 2], mode='foo')
+
 
 def test_flatten_len():
     alist = [[1, 2], [3, 4], [5, 6]]
@@ -93,6 +125,38 @@ def test_flatten_len():
     assert flatools.flatten_len(alist) == 0
 
 
+def test_flatten_enumerate():
+    alist = [1, [2, [3, 4]], [5]]
+    expected_result = [((0, ), 1), ((1, 0), 2), ((1, 1, 0), 3),
+                       ((1, 1, 1), 4), ((2, 0), 5)]
+    assert list(flatools.flatten_enumerate(alist)) == expected_result
+
+    expected_result = [((0, ), 1), ((1, 0), 2), ((1, 1), [3, 4]),
+                       ((2, 0), 5)]
+    result = list(flatools.flatten_enumerate(alist, max_depth=2))
+    assert result == expected_result
+    result = list(flatools.flatten_enumerate(alist, max_depth=1))
+    assert result == [((0, ), 1), ((1, ), [2, [3, 4]]), ((2, ), [5])]
+
+    alist = [[], [[[]], 'foo']]
+    assert list(flatools.flatten_enumerate(alist)) == [((1, 1), 'foo')]
+    assert list(flatools.flatten_enumerate([])) == []
+
+    alist = [1, [2.2, True], ['foo', [(1, 4), None]]]
+    for path, value in flatools.flatten_enumerate(alist):
+        item = alist
+        for i in path:
+            item = item[i]
+        assert item is value
+
+    with pytest.raises(TypeError):
+        list(flatools.flatten_enumerate((1, 2)))
+    with pytest.raises(TypeError):
+        list(flatools.flatten_enumerate([1, 2], max_depth=1.0))
+    with pytest.raises(ValueError):
+        list(flatools.flatten_enumerate([1, 2], max_depth=0))
+
+
 def test_flatten_index():
     alist = [[1, 2], [3, 4], [5, 6]]
     assert flatools.flatten_index(3, alist) == 2
@@ -104,6 +168,129 @@ def test_flatten_index():
         alist = [[1, 2], [3, 4], [5, 6]]
         flatools.flatten_index(7, alist)
 
+    alist = [1, [2, [3, 4]], [5, 6]]
+    assert flatools.flatten_index(4, alist, path=True) == (3, (1, 1, 1))
+    assert flatools.flatten_index(1, alist, path=True) == (0, (0,))
+    assert flatools.flatten_index(6, alist, path=True) == (5, (2, 1))
+
+    alist = [[], [[], [0.0, None]]]
+    assert flatools.flatten_index(None, alist, path=True) == (1, (1, 1, 1))
+
+    with pytest.raises(ValueError):
+        alist = [[1, 2], [3, 4], [5, 6]]
+        flatools.flatten_index(7, alist, path=True)
+
+
+def test_flatten_chunks():
+    from array import array
+
+    alist = [1, [2, [3, 4]], [5, 6, [7]]]
+    result = list(flatools.flatten_chunks(alist, 3))
+    assert result == [[1, 2, 3], [4, 5, 6], [7]]
+    result = list(flatools.flatten_chunks(alist, 1))
+    assert result == [[1], [2], [3], [4], [5], [6], [7]]
+    result = list(flatools.flatten_chunks(alist, 10))
+    assert result == [[1, 2, 3, 4, 5, 6, 7]]
+
+    alist = [list(range(10)), [[], list(range(10, 25))], 25]
+    result = list(flatools.flatten_chunks(alist, 4))
+    assert result == [list(range(i, min(i + 4, 26))) for i in range(0, 26, 4)]
+
+    alist = [[1.5, 2.0], [3.0]]
+    result = list(flatools.flatten_chunks(alist, 2, typecode='d'))
+    assert result == [array('d', [1.5, 2.0]), array('d', [3.0])]
+
+    assert list(flatools.flatten_chunks([[], [[]]], 2)) == []
+
+    with pytest.raises(TypeError):
+        list(flatools.flatten_chunks((1, 2), 2))
+    with pytest.raises(ValueError):
+        list(flatools.flatten_chunks([1, 2], 0))
+    with pytest.raises(ValueError):
+        list(flatools.flatten_chunks([1, 2], 2, typecode='x'))
+
+
+def test_flatten_contains():
+    alist = [[1, 2], [3, 4], [5, 6]]
+    assert flatools.flatten_contains(3, alist) == True
+    assert flatools.flatten_contains(7, alist) == False
+
+    alist = [1, [2.2, True], ['foo', [(1, 4), None]], [3+2j, {'a': 1}]]
+    assert flatools.flatten_contains(None, alist) == True
+    assert flatools.flatten_contains('bar', alist) == False
+
+    assert flatools.flatten_contains(1, []) == False
+
+    with pytest.raises(TypeError):
+        flatools.flatten_contains([1], [[1]])
+
+
+def test_flatten_to_array():
+    from array import array
+
+    alist = [[1.5, 2.0], [3.25, [4.0]]]
+    expected_result = array('d', [1.5, 2.0, 3.25, 4.0])
+    assert flatools.flatten_to_array(alist) == expected_result
+
+    alist = [1, [2, [3, 4]], 5]
+    assert flatools.flatten_to_array(alist, 'i') == array('i', [1, 2, 3, 4, 5])
+
+    alist = [[[]], list(range(10000)), [[1], 2]]
+    expected_result = array('q', list(range(10000)) + [1, 2])
+    assert flatools.flatten_to_array(alist, 'q') == expected_result
+
+    assert flatools.flatten_to_array([]) == array('d')
+
+    buffer = array('d', [0.0] * 5)
+    view = flatools.flatten_to_array([1.0, [2.0, 3.0]], out=buffer)
+    assert view.tolist() == [1.0, 2.0, 3.0]
+    assert buffer == array('d', [1.0, 2.0, 3.0, 0.0, 0.0])
+
+    buffer = bytearray(8)
+    view = flatools.flatten_to_array([[1], 2], 'i', out=buffer)
+    assert view.tolist() == [1, 2]
+    assert buffer == bytes(array('i', [1, 2]))
+
+    with pytest.raises(TypeError):
+        flatools.flatten_to_array([1, [2, 'foo']])
+    with pytest.raises(OverflowError):
+        flatools.flatten_to_array([1, [300]], 'b')
+    with pytest.raises(ValueError):
+        flatools.flatten_to_array([1, [2, 3]], out=array('d', [0.0] * 2))
+    with pytest.raises(ValueError):
+        flatools.flatten_to_array([1], 'x')
+    with pytest.raises(TypeError):
+        flatools.flatten_to_array([1], out=bytes(8))
+    with pytest.raises(TypeError):
+        flatools.flatten_to_array((1, 2))
+
+
+def test_flatten_with_shape():
+    alist = [1, [2, [3, 4]], [5]]
+    flat, shape = flatools.flatten_with_shape(alist)
+    assert flat == [1, 2, 3, 4, 5]
+    assert shape.size == 5
+    assert shape == flatools.FlatShape(['a', ['b', ['c', 'd']], ['e']])
+    assert hash(shape) == hash(flatools.FlatShape(alist))
+    assert shape != flatools.FlatShape([1, [2, 3, 4], [5]])
+    assert flatools.unflatten(flat, shape) == alist
+
+    alist = [[], [[1, 2], []], 3, [[[]]]]
+    flat, shape = flatools.flatten_with_shape(alist)
+    assert flat == [1, 2, 3]
+    assert flatools.unflatten(flat, shape) == alist
+    assert flatools.unflatten(iter('abc'), shape) == [[], [['a', 'b'], []],
+                                                      'c', [[[]]]]
+
+    flat, shape = flatools.flatten_with_shape([])
+    assert flat == []
+    assert flatools.unflatten([], shape) == []
+
+    with pytest.raises(TypeError):
+        flatools.flatten_with_shape((1, 2))
+    with pytest.raises(TypeError):
+        flatools.FlatShape((1, 2))
+
 
 def test_flatten_zip_cycle():
     alist = [1, 2]
@@ -149,6 +336,29 @@ def test_flatten_zip_cycle():
     with pytest.raises(StopIteration):
         flatten_zip_cycle_iter.__next__()
 
+    alist = [[1, 2, 3], [4]]
+    blist = [[[5]], 6]
+    clist = [7, [8, 9]]
+    flatten_zip_cycle_iter = flatools.flatten_zip_cycle(alist, blist, clist)
+    assert flatten_zip_cycle_iter.__next__() == (1, 5, 7)
+    assert flatten_zip_cycle_iter.__next__() == (2, 6, 8)
+    assert flatten_zip_cycle_iter.__next__() == (3, 5, 9)
+    assert flatten_zip_cycle_iter.__next__() == (4, 6, 7)
+    with pytest.raises(StopIteration):
+        flatten_zip_cycle_iter.__next__()
+
+    flatten_zip_cycle_iter = flatools.flatten_zip_cycle([[]], [[], []])
+    with pytest.raises(StopIteration):
+        flatten_zip_cycle_iter.__next__()
+
+    flatten_zip_cycle_iter = flatools.flatten_zip_cycle([1, 2], [[]])
+    with pytest.raises(IndexError):
+        flatten_zip_cycle_iter.__next__()
+
+    flatten_zip_cycle_iter = flatools.flatten_zip_cycle()
+    with pytest.raises(ValueError):
+        flatten_zip_cycle_iter.__next__()
+
 
 def test_flatten_sorted():
     alist = [[1, 4], [5, 7], [2], [9, 6, 10], [8, 3]]
@@ -173,6 +383,46 @@ def test_flatten_sorted():
     assert flatools.flatten_sorted([]) == []
 
 
+def test_flatten_plan():
+    plan = flatools.FlattenPlan([[1, 2], [3, [4, 5]]])
+    assert plan.size == 5
+    assert plan.paths == ((0, 0), (0, 1), (1, 0), (1, 1, 0), (1, 1, 1))
+    record = [['a', 'b'], ['c', ['d', 'e']]]
+    assert plan.matches(record)
+    assert plan(record) == ['a', 'b', 'c', 'd', 'e']
+    assert plan(record) == flatools.flatten(record)
+
+    record = [[1, 2], [3, 4]]
+    assert not plan.matches(record)
+    assert plan(record) == [1, 2, 3, 4]
+    record = [[1, [2]], [3, [4, 5]]]
+    assert not plan.matches(record)
+    assert plan(record) == [1, 2, 3, 4, 5]
+    assert not plan.matches([[1, 2], [3, [4, 5]], 6])
+    assert not plan.matches(((1, 2), (3, (4, 5))))
+    assert not plan.matches([{0: 1, 1: 2}, [3, [4, 5]]])
+
+    class SubList(list):
+        pass
+
+    record = [[1, SubList([2, 3])], [4, [5, 6]]]
+    assert not plan.matches(record)
+    assert plan(record) == [1, 2, 3, 4, 5, 6]
+
+    plan = flatools.FlattenPlan([[], 1, [[2], []]])
+    assert plan.paths == ((1, ), (2, 0, 0))
+    assert plan([[], 'a', [['b'], []]]) == ['a', 'b']
+
+    plan = flatools.FlattenPlan([])
+    assert plan([]) == []
+    assert plan([1, [2]]) == [1, 2]
+
+    with pytest.raises(TypeError):
+        flatools.FlattenPlan((1, 2))
+    with pytest.raises(TypeError):
+        plan((1, 2))
+
+
 def test_flatten_reverse():
     alist = [[1, 4], [5, 7], [2], [9, 6, 10], [8, 3]]
     expected_result = [10, 9, 8, 7, 6, 5, 4, 3, 2, 1]
@@ -259,6 +509,9 @@ def test_flatten_single_type():
     alist = []
     assert flatools.flatten_single_type(alist) == False
 
+    alist = [[[]], [1, [2.0]], [3] * 1000]
+    assert flatools.flatten_single_type(alist) == False
+
 
 def test_flatten_mixed_type():
     alist = [[1, 4], [5, 7], [2], [9, 6, 10], [8, 3]]
@@ -279,6 +532,34 @@ def test_flatten_mixed_type():
     alist = []
     assert flatools.flatten_mixed_type(alist) == False
 
+    alist = [[[]], [1, [2.0]], [3] * 1000]
+    assert flatools.flatten_mixed_type(alist) == True
+
+
+def test_flatten_memo():
+    shared = [[1, 2], [3, [4]]]
+    alist = [shared, [0, shared], shared]
+    expected_result = [1, 2, 3, 4, 0, 1, 2, 3, 4, 1, 2, 3, 4]
+    assert flatools.flatten(alist, memo=True) == expected_result
+    assert flatools.flatten(alist) == expected_result
+
+    alist = [1]
+    for _ in range(20):
+        alist = [alist, [alist]]
+    assert flatools.flatten(alist, memo=True) == [1] * 2 ** 20
+
+    empty = []
+    alist = [empty, [empty, 1], empty]
+    assert flatools.flatten(alist, memo=True) == [1]
+
+    shared = (1, [2, (3, )])
+    atuple = (shared, shared, [shared])
+    assert (flatools.flatten(atuple, types=(list, tuple), memo=True)
+            == [1, 2, 3] * 3)
+
+    with pytest.raises(TypeError):
+        flatools.flatten([1], memo=1)
+
 
 def test_flatten_choice():
     random.seed(87452)
@@ -290,3 +571,379 @@ def test_flatten_choice():
 
     alist = [1, [2.2, True], ['foo', [(1, 4), None]], [3+2j, {'a': 1}]]
     assert flatools.flatten_choice(alist) == (1, 4)
+
+    alist = [[1, 4], [5, 7], [2], [9, 6, 10], [8, 3]]
+    rng = random.Random(42)
+    assert flatools.flatten_choice(alist, 3, rng=rng) == [4, 1, 2]
+
+    flat = flatools.FlatView(alist)
+    samples = flatools.flatten_choice(flat, 1000)
+    assert len(samples) == 1000
+    assert set(samples) == set(range(1, 11))
+    assert flatools.flatten_choice(flat) in range(1, 11)
+
+    samples = flatools.flatten_choice(alist, 10, replace=False)
+    assert sorted(samples) == list(range(1, 11))
+    assert flatools.flatten_choice(alist, 0) == []
+
+    rng_1 = random.Random(87452)
+    rng_2 = random.Random(87452)
+    assert (flatools.flatten_choice(alist, 5, replace=False, rng=rng_1)
+            == flatools.flatten_choice(flat, 5, replace=False, rng=rng_2))
+
+    with pytest.raises(ValueError):
+        flatools.flatten_choice(alist, 11, replace=False)
+    with pytest.raises(IndexError):
+        flatools.flatten_choice([[]])
+    with pytest.raises(IndexError):
+        flatools.flatten_choice([[]], 2)
+
+
+def test_iflatten():
+    alist = [[1, 2], [3, 4], [5], [6, 7, 8], [9, 10]]
+    expected_result = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    assert list(flatools.iflatten(alist)) == expected_result
+
+    alist = [1, 2, [3, [4, 5]]]
+    iflatten_iter = flatools.iflatten(alist)
+    assert iflatten_iter.__next__() == 1
+    assert iflatten_iter.__next__() == 2
+    assert iflatten_iter.__next__() == 3
+    assert iflatten_iter.__next__() == 4
+    assert iflatten_iter.__next__() == 5
+    with pytest.raises(StopIteration):
+        iflatten_iter.__next__()
+
+    alist = [1, [2.2, True], ['foo', [(1, 4), None]], [3+2j, {'a': 1}]]
+    expected_result = [1, 2.2, True, 'foo', (1, 4), None, 3+2j, {'a': 1}]
+    assert list(flatools.iflatten(alist)) == expected_result
+
+    assert list(flatools.iflatten([[], [[]]])) == []
+
+    with pytest.raises(TypeError):
+        flatools.iflatten((1, 2)).__next__()
+
+
+def test_ipflatten():
+    alist = [[1, 2], [3, 4], [5], [6, 7, 8], [9, 10]]
+    expected_result = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    assert list(flatools.ipflatten(alist)) == expected_result
+
+    alist = [1, 2, [3, [[4], 5]]]
+    ipflatten_iter = flatools.ipflatten(alist)
+    assert ipflatten_iter.__next__() == 1
+    assert ipflatten_iter.__next__() == 2
+    assert ipflatten_iter.__next__() == 3
+    assert ipflatten_iter.__next__() == [[4], 5]
+    with pytest.raises(StopIteration):
+        ipflatten_iter.__next__()
+
+    assert list(flatools.ipflatten(alist, depth=2)) == [1, 2, 3, [4], 5]
+    assert list(flatools.ipflatten(alist, depth=3)) == [1, 2, 3, 4, 5]
+    assert list(flatools.ipflatten(alist, depth=0)) == alist
+
+    assert list(flatools.ipflatten([])) == []
+
+
+def test_flat_view():
+    alist = [1, [2, [3, 4]], [5, 6]]
+    flat = flatools.FlatView(alist)
+    assert len(flat) == 6
+    assert [flat[i] for i in range(6)] == [1, 2, 3, 4, 5, 6]
+    assert flat[-1] == 6
+    assert flat[-6] == 1
+    assert flat[1:4] == [2, 3, 4]
+    assert flat[::2] == [1, 3, 5]
+    assert flat[::-2] == [6, 4, 2]
+    assert flat[4:1] == []
+    assert list(flat) == [1, 2, 3, 4, 5, 6]
+    assert list(reversed(flat)) == [6, 5, 4, 3, 2, 1]
+    assert 4 in flat
+    assert flat.index(5) == 4
+    with pytest.raises(IndexError):
+        flat[6]
+    with pytest.raises(IndexError):
+        flat[-7]
+
+    alist = [[1, 2], [3, 4]]
+    blist = [[[5], 6], 7]
+    flat = flatools.FlatView(alist, blist)
+    expected_result = flatools.flatten_join(alist, blist)
+    assert len(flat) == 7
+    assert [flat[i] for i in range(7)] == expected_result
+    assert flat[2:6] == expected_result[2:6]
+
+    shared = [1, [2, 3]]
+    alist = [[], shared, [[]], 4, shared, [5]]
+    flat = flatools.FlatView(alist)
+    expected_result = flatools.flatten(alist)
+    assert len(flat) == len(expected_result)
+    assert [flat[i] for i in range(len(flat))] == expected_result
+    assert list(reversed(flat)) == expected_result[::-1]
+
+    flat = flatools.FlatView()
+    assert len(flat) == 0
+    assert list(flat) == []
+
+    with pytest.raises(TypeError):
+        flatools.FlatView((1, 2))
+
+
+def test_flatten_stats():
+    alist = [1, [2, [3, 4]], [5.0]]
+    stats = flatools.flatten_stats(alist)
+    assert stats.count == 5
+    assert stats.sum == 15.0
+    assert stats.min == 1
+    assert stats.max == 5.0
+    assert stats.types == {int, float}
+    assert stats.max_depth == 3
+    assert stats.depth_counts == {1: 1, 2: 2, 3: 2}
+
+    alist = [-1, -5, [3, [-2, 4]]]
+    stats = flatools.flatten_stats(alist, start=4)
+    assert stats.count == flatools.flatten_len(alist)
+    assert stats.sum == flatools.flatten_sum(alist, start=4)
+    assert stats.min == flatools.flatten_min(alist)
+    assert stats.max == flatools.flatten_max(alist)
+
+    alist = [1, ['foo', [None]]]
+    stats = flatools.flatten_stats(alist)
+    assert stats.count == 3
+    assert stats.sum is None
+    assert stats.min is None
+    assert stats.max is None
+    assert stats.types == {int, str, type(None)}
+
+    stats = flatools.flatten_stats([[], [[]]])
+    assert stats.count == 0
+    assert stats.sum == 0
+    assert stats.min is None
+    assert stats.max is None
+    assert stats.types == set()
+    assert stats.max_depth == 0
+    assert stats.depth_counts == {}
+
+
+def test_flatools_numpy():
+    numpy = pytest.importorskip('numpy')
+
+    array = numpy.array([[1, 2], [3, 4]])
+    assert flatools.flatten(array) == [1, 2, 3, 4]
+    arrays = [numpy.array([1, 2]), numpy.array([3, 4])]
+    for flat in (flatools.flatten(arrays), list(flatools.iflatten(arrays)),
+                 flatools.flatten_join(arrays)):
+        assert len(flat) == flatools.flatten_len(arrays) == 2
+        assert flat[0] is arrays[0] and flat[1] is arrays[1]
+    assert flatools.flatten_sum(arrays).tolist() == [4, 6]
+    assert flatools.flatten_sum(arrays, mode='pairwise').tolist() == [4, 6]
+    assert flatools.flatten_sum(array, start=1) == 11
+    assert flatools.flatten_max(array) == 4
+    assert flatools.flatten_min(array) == 1
+    assert flatools.flatten_min(array, key=lambda x: -x) == 4
+    assert flatools.flatten_sorted(array, reverse=True) == [4, 3, 2, 1]
+    assert flatools.flatten_reverse(array) == [4, 3, 2, 1]
+    assert flatools.flatten_max(numpy.array([]), default=-100) == -100
+
+    random.seed(87452)
+    alist = [[random.random() for _ in range(40)] for _ in range(30)]
+    flat = flatools.flatten(alist)
+    assert flatools.flatten_sum(alist) == sum(flat)
+    assert flatools.flatten_sum(numpy.array(alist)) == sum(flat)
+    assert flatools.flatten_max(alist) == max(flat)
+    assert flatools.flatten_min(alist) == min(flat)
+    assert flatools.flatten_sorted(alist) == sorted(flat)
+    assert flatools.flatten_reverse(alist) == sorted(flat, reverse=True)
+    assert type(flatools.flatten_max(alist)) is float
+
+    alist = [[-0.0, 0.0] * 300, [0.0, -0.0] * 300]
+    for input_list in (alist, numpy.array(alist)):
+        results = (flatools.flatten_min(input_list),
+                   flatools.flatten_max(input_list))
+        results += flatools.flatten_minmax(input_list)
+        assert [str(result) for result in results] == ['-0.0'] * 4
+
+    alist = [[[random.randint(-10, 10) for _ in range(10)] for _ in range(10)]
+             for _ in range(10)]
+    flat = flatools.flatten(alist)
+    assert flatools.flatten_sum(alist) == sum(flat)
+    assert flatools.flatten_sorted(alist) == sorted(flat)
+    assert type(flatools.flatten_sum(alist)) is int
+    assert type(flatools.flatten_sorted(alist)[0]) is int
+
+    assert flatools.flatten_single_type(array) == True
+    assert flatools.flatten_mixed_type(array) == False
+    array = numpy.array([[1, 'a'], [None, 2]], dtype=object)
+    assert flatools.flatten_single_type(array) == False
+    assert flatools.flatten_mixed_type(array) == True
+    assert flatools.flatten_single_type(numpy.array([])) == False
+
+    alist = [[2 ** 62] * 100] * 10
+    assert flatools.flatten_sum(alist) == 1000 * 2 ** 62
+
+    alist = [[1] * 100 for _ in range(10)]
+    alist[5][5] = 1.0
+    assert type(flatools.flatten_sorted(alist)[50]) is int
+
+
+def test_iflatten_sorted():
+    alist = [[1, 4, 7], [2, 5, 8], [3, 6, 9]]
+    iflatten_sorted_iter = flatools.iflatten_sorted(alist)
+    assert iflatten_sorted_iter.__next__() == 1
+    assert iflatten_sorted_iter.__next__() == 2
+    assert list(iflatten_sorted_iter) == [3, 4, 5, 6, 7, 8, 9]
+
+    alist = [[1, 4], [5, 7], [2], [9, 6, 10], [8, 3]]
+    expected_result = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    assert list(flatools.iflatten_sorted(alist)) == expected_result
+
+    alist = [-1, -5, [3, [-2, 4]]]
+    assert list(flatools.iflatten_sorted(alist)) == [-5, -2, -1, 3, 4]
+    expected_result = [-1, -2, 3, 4, -5]
+    assert list(flatools.iflatten_sorted(alist, key=abs)) == expected_result
+    iflatten_sorted_iter = flatools.iflatten_sorted(alist, reverse=True)
+    assert list(iflatten_sorted_iter) == [4, 3, -1, -2, -5]
+
+    alist = [[3, 1.4], [5, 7.8], [-3.1, 6.6]]
+    expected_result = [-3.1, 1.4, 3, 5, 6.6, 7.8]
+    assert list(flatools.iflatten_sorted(alist)) == expected_result
+
+    random.seed(87452)
+    alist = [[random.randint(0, 9) for _ in range(random.randint(0, 9))]
+             for _ in range(20)]
+    alist = [sorted(sublist) if i % 3 else sublist
+             for i, sublist in enumerate(alist)]
+    alist[7].append(alist[4])
+    flat = flatools.flatten(alist)
+    for key in (None, lambda x: x % 3):
+        for reverse in (False, True):
+            iflatten_sorted_iter = flatools.iflatten_sorted(alist,
+                                                            key=key,
+                                                            reverse=reverse)
+            expected_result = sorted(flat, key=key, reverse=reverse)
+            assert list(iflatten_sorted_iter) == expected_result
+
+    assert list(flatools.iflatten_sorted([[], [[]]])) == []
+
+    keys = []
+
+    def key(element):
+        keys.append(element)
+        return element['k']
+
+    alist = [[{'k': 2}, {'k': 1}], {'k': 1}, [{'k': 2}, [{'k': 0}]]]
+    flat = flatools.flatten(alist)
+    for reverse in (False, True):
+        del keys[:]
+        result = list(flatools.iflatten_sorted(alist, key=key,
+                                               reverse=reverse))
+        expected_result = sorted(flat, key=lambda x: x['k'], reverse=reverse)
+        assert [id(x) for x in result] == [id(x) for x in expected_result]
+        assert len(keys) == len(flat)
+
+
+def test_flatten_nlargest():
+    alist = [[1, 4], [5, 7], [2], [9, 6, 10], [8, 3]]
+    assert flatools.flatten_nlargest(alist, 3) == [10, 9, 8]
+
+    alist = [[3, 1.4], [5, 7.8], [-3.1, 6.6]]
+    assert flatools.flatten_nlargest(alist, 2) == [7.8, 6.6]
+
+    alist = [-1, -5, [3, [-2, 4]]]
+    assert flatools.flatten_nlargest(alist, 2, key=abs) == [-5, 4]
+    assert flatools.flatten_nlargest(alist, 10) == [4, 3, -1, -2, -5]
+    assert flatools.flatten_nlargest(alist, 0) == []
+
+    assert flatools.flatten_nlargest([], 3) == []
+
+
+def test_flatten_nsmallest():
+    alist = [[1, 4], [5, 7], [2], [9, 6, 10], [8, 3]]
+    assert flatools.flatten_nsmallest(alist, 3) == [1, 2, 3]
+
+    alist = [[3, 1.4], [5, 7.8], [-3.1, 6.6]]
+    assert flatools.flatten_nsmallest(alist, 2) == [-3.1, 1.4]
+
+    alist = [-1, -5, [3, [-2, 4]]]
+    assert flatools.flatten_nsmallest(alist, 2, key=abs) == [-1, -2]
+    assert flatools.flatten_nsmallest(alist, 10) == [-5, -2, -1, 3, 4]
+    assert flatools.flatten_nsmallest(alist, 0) == []
+
+    assert flatools.flatten_nsmallest([], 3) == []
+
+
+def test_flatten_minmax():
+    alist = [[1, 4], [5, 7], [2], [9, 6, 10], [8, 3]]
+    assert flatools.flatten_minmax(alist) == (1, 10)
+
+    alist = [3, 4, [1, [5, 2]]]
+    assert flatools.flatten_minmax(alist) == (1, 5)
+
+    alist = [[3, 1.4], [5, 7.8], [-3.1, 6.6]]
+    assert flatools.flatten_minmax(alist) == (-3.1, 7.8)
+
+    alist = [-1, -5, [3, [-2, 4]]]
+    assert flatools.flatten_minmax(alist, key=abs) == (-1, -5)
+
+    alist = [[1], [-1, 1]]
+    assert flatools.flatten_minmax(alist, key=abs) == (1, 1)
+
+    alist = []
+    assert flatools.flatten_minmax(alist, default=-100) == (-100, -100)
+
+
+def test_flatten_types():
+    from array import array
+    from collections import deque
+
+    alist = [1, (2, 3), [4, (5, [6])]]
+    assert flatools.flatten(alist, types=(list, tuple)) == [1, 2, 3, 4, 5, 6]
+    atuple = (1, [2, 3], (4, [5]))
+    assert flatools.flatten(atuple, types=tuple) == [1, [2, 3], 4, [5]]
+    assert (list(flatools.iflatten(alist, types=(list, tuple)))
+            == [1, 2, 3, 4, 5, 6])
+    assert (flatools.pflatten(alist, depth=2, types=(list, tuple))
+            == [1, 2, 3, 4, 5, [6]])
+    assert (list(flatools.ipflatten(alist, depth=2, types=(list, tuple)))
+            == [1, 2, 3, 4, 5, [6]])
+
+    adeque = deque([1, deque([2, array('i', [3, 4])]), 'foo', b'bar'])
+    expected_result = [1, 2, 3, 4, 'foo', b'bar']
+    assert flatools.flatten(adeque, types=(deque, array)) == expected_result
+
+    agen = (x for x in [1, 2])
+    alist = [0, agen, [3]]
+    assert (flatools.flatten(alist, types=(list, type(agen)))
+            == [0, 1, 2, 3])
+
+    assert flatools.flatten([1, (2, [3])]) == [1, (2, [3])]
+
+    with pytest.raises(TypeError):
+        flatools.flatten((1, 2), types=list)
+    with pytest.raises(TypeError):
+        flatools.flatten([1, 2], types=[list])
+    with pytest.raises(TypeError):
+        flatools.flatten([1, 2], types=())
+    with pytest.raises(ValueError):
+        flatools.flatten([1, 2], types=(list, str))
+    with pytest.raises(ValueError):
+        flatools.iflatten([1, 2], types=str).__next__()
+
+
+def test_unflatten():
+    shape = flatools.FlatShape([1, [2, [3, 4]], [5]])
+    result = flatools.unflatten([10, 20, 30, 40, 50], shape)
+    assert result == [10, [20, [30, 40]], [50]]
+    assert flatools.unflatten(range(5), shape) == [0, [1, [2, 3]], [4]]
+
+    template = [[None, None], [[None], None]]
+    assert flatools.unflatten(range(4), template) == [[0, 1], [[2], 3]]
+
+    with pytest.raises(ValueError):
+        flatools.unflatten([1, 2, 3, 4], shape)
+    with pytest.raises(ValueError):
+        flatools.unflatten([1, 2, 3, 4, 5, 6], shape)
+    with pytest.raises(TypeError):
+        flatools.unflatten([1, 2], (1, 2))
+    with pytest.raises(TypeError):
+        flatools.unflatten(1, shape)
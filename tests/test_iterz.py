@@ -1,4 +1,5 @@
 import pytest
+import sys
 from listools import iterz
 
 
@@ -53,6 +54,40 @@ def test_zip_cycle():
     with pytest.raises(IndexError):
         iterz.zip_cycle(alist).__next__()
 
+    agen = (x for x in range(2))
+    zip_cycle_iter = iterz.zip_cycle(agen, 'abcde')
+    assert list(zip_cycle_iter) == [(0, 'a'), (1, 'b'), (0, 'c'), (1, 'd'),
+                                    (0, 'e')]
+
+    agen = (x for x in range(5))
+    bgen = (x for x in range(3))
+    zip_cycle_iter = iterz.zip_cycle(agen, bgen, [7])
+    assert list(zip_cycle_iter) == [(0, 0, 7), (1, 1, 7), (2, 2, 7),
+                                    (3, 0, 7), (4, 1, 7)]
+
+    agen = (x for x in range(0))
+    with pytest.raises(IndexError):
+        iterz.zip_cycle(agen, [1, 2]).__next__()
+
+    import weakref
+
+    class Item:
+        pass
+
+    refs = []
+
+    def items_gen():
+        for _ in range(10):
+            item = Item()
+            refs.append(weakref.ref(item))
+            yield item
+
+    zip_cycle_iter = iterz.zip_cycle(items_gen(), [1, 2])
+    for _ in range(8):
+        zip_cycle_iter.__next__()
+    assert all(ref() is None for ref in refs[2:-1])
+    assert len(list(zip_cycle_iter)) == 2
+
 
 def test_zip_longest():
     alist = [1, 2]
@@ -97,6 +132,17 @@ def test_zip_longest():
     with pytest.raises(IndexError):
         iterz.zip_cycle(alist).__next__()
 
+    agen = (x for x in range(2))
+    zip_longest_iter = iterz.zip_longest(agen, 'abc', default=0)
+    assert list(zip_longest_iter) == [(0, 'a'), (1, 'b'), (0, 'c')]
+
+    agen = (x for x in range(0))
+    with pytest.raises(IndexError):
+        iterz.zip_longest(agen, [1, 2]).__next__()
+
+    with pytest.raises(ValueError):
+        iterz.zip_longest().__next__()
+
 
 def test_zip_inf_cycle():
     alist = [1, 2]
@@ -146,6 +192,10 @@ def test_zip_inf_cycle():
     assert zip_inf_cycle_iter.__next__() == (2,)
     assert zip_inf_cycle_iter.__next__() == (3,)
 
+    zip_inf_cycle_iter = iterz.zip_inf_cycle()
+    assert zip_inf_cycle_iter.__next__() == ()
+    assert zip_inf_cycle_iter.__next__() == ()
+
     alist = [1, 2]
     blist = [1, 2, 3, 4]
     clist = [1, 2, 3, 4, 5, 6]
@@ -253,6 +303,16 @@ def test_inf_cycle():
     with pytest.raises(StopIteration):
         inf_cycle_iter.__next__()
 
+    agen = (x ** 2 for x in range(3))
+    inf_cycle_iter = iterz.inf_cycle(agen)
+    assert [inf_cycle_iter.__next__() for _ in range(7)] == [0, 1, 4, 0, 1,
+                                                              4, 0]
+
+    agen = (x for x in range(0))
+    inf_cycle_iter = iterz.inf_cycle(agen)
+    with pytest.raises(StopIteration):
+        inf_cycle_iter.__next__()
+
 
 def test_ncycle():
     alist = [1, 2, 4, 8]
@@ -287,6 +347,18 @@ def test_ncycle():
     with pytest.raises(StopIteration):
         ncycle_iter.__next__()
 
+    agen = (x ** 2 for x in range(3))
+    assert list(iterz.ncycle(agen, 2)) == [0, 1, 4, 0, 1, 4]
+    agen = (x ** 2 for x in range(3))
+    assert list(iterz.ncycle(agen, 1)) == [0, 1, 4]
+    agen = (x ** 2 for x in range(3))
+    assert list(iterz.ncycle(agen, 0)) == []
+
+    ncycle_iter = iterz.ncycle([1, 2], sys.maxsize + 1)
+    assert [ncycle_iter.__next__() for _ in range(3)] == [1, 2, 1]
+    ncycle_iter = iterz.ncycle((x for x in range(2)), sys.maxsize + 2)
+    assert [ncycle_iter.__next__() for _ in range(3)] == [0, 1, 0]
+
 
 def test_cycle_until_index():
     alist = [1, 2, 4, 8, 16, 32]
@@ -313,6 +385,19 @@ def test_cycle_until_index():
     with pytest.raises(StopIteration):
         cycle_until_index_iter.__next__()
 
+    agen = (x ** 2 for x in range(10))
+    assert list(iterz.cycle_until_index(agen, 2)) == [0, 1, 4]
+    assert agen.__next__() == 9
+
+    agen = (x ** 2 for x in range(10))
+    with pytest.raises(ValueError):
+        iterz.cycle_until_index(agen, -2).__next__()
+
+    alist = [1, 2, 3]
+    assert list(iterz.cycle_until_index(alist, sys.maxsize)) == [1, 2, 3]
+    agen = (x for x in range(3))
+    assert list(iterz.cycle_until_index(agen, sys.maxsize)) == [0, 1, 2]
+
 
 def test_iter_mask():
     alist = [1, 2, 3]
@@ -364,3 +449,166 @@ def test_iter_mask():
     iter_mask_iter = iterz.iter_mask(alist, mask)
     with pytest.raises(IndexError):
         iter_mask_iter.__next__()
+
+    agen = (x for x in range(10))
+    assert list(iterz.iter_mask(agen, [1, 0, 0])) == [0, 3, 6, 9]
+
+    alist = [1, 2]
+    mask = [1, 0, 1, 1]
+    assert list(iterz.iter_mask(alist, mask)) == [1, 1, 2]
+    assert list(iterz.iter_mask(iter(alist), mask)) == [1, 1, 2]
+    assert list(iterz.iter_mask([1, 2, 3], [0, 0, 0, 1])) == [1]
+    assert list(iterz.iter_mask(iter([]), mask)) == []
+
+
+def test_cyclic_view():
+    cycled = iterz.ncycle([1, 2, 4, 8], 3, view=True)
+    assert isinstance(cycled, iterz.CyclicView)
+    assert len(cycled) == 12
+    assert cycled.__length_hint__() == 12
+    assert cycled[5] == 2
+    assert cycled[-1] == 8
+    assert list(cycled) == list(iterz.ncycle([1, 2, 4, 8], 3))
+    assert list(cycled[2:7]) == [4, 8, 1, 2, 4]
+    assert list(cycled[7:2:-2]) == [8, 2, 8]
+    assert list(reversed(cycled[:4])) == [8, 4, 2, 1]
+    with pytest.raises(IndexError):
+        cycled[12]
+    with pytest.raises(TypeError):
+        cycled['foo']
+
+    huge = iterz.ncycle([1, 2, 3], 10 ** 12, view=True)
+    assert huge[10 ** 9] == 2
+    assert list(huge[10 ** 9:10 ** 9 + 4]) == [2, 3, 1, 2]
+
+    a = [1, 2]
+    b = 'abc'
+    c = (1.0, 2.0, 3.0, 4.0)
+    zipped = iterz.zip_cycle(a, b, c, view=True)
+    assert list(zipped) == list(iterz.zip_cycle(a, b, c))
+    assert zipped[-1] == (2, 'a', 4.0)
+    zipped = iterz.zip_syzygy(a, b, c, view=True)
+    assert len(zipped) == 12
+    assert list(zipped) == list(iterz.zip_syzygy(a, b, c))
+    assert list(reversed(zipped)) == list(zipped)[::-1]
+
+    alist = [1, 2, 4, 8, 16, 32]
+    view = iterz.cycle_until_index(alist, 4, view=True)
+    assert list(view) == list(iterz.cycle_until_index(alist, 4))
+    assert (len(view), view[-1]) == (5, 16)
+
+    assert len(iterz.ncycle([], 3, view=True)) == 0
+    with pytest.raises(TypeError):
+        iterz.ncycle((x for x in range(3)), 2, view=True)
+    with pytest.raises(IndexError):
+        iterz.zip_cycle([1], [], view=True)
+    with pytest.raises(TypeError):
+        iterz.zip_syzygy([1], [2], view=1)
+    with pytest.raises(TypeError):
+        iterz.ncycle({'a': 1, 'b': 2}, 2, view=True)
+    with pytest.raises(TypeError):
+        iterz.zip_cycle([1], {0: 'a', 1: 'b'}, view=True)
+
+
+def test_cyclic_view_period():
+    zipped = iterz.zip_syzygy(range(997), range(991), range(983), view=True)
+    assert zipped.period == 997 * 991 * 983
+    assert len(zipped) == zipped.period
+    assert zipped[900000000] == (900000000 % 997, 900000000 % 991,
+                                 900000000 % 983)
+    assert next(iter(zipped[900000000:])) == zipped[900000000]
+
+    window = zipped[10 ** 6:10 ** 6 + 10]
+    chunks = list(window.chunks(4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert [item for chunk in chunks for item in chunk] == list(window)
+    assert list(window) == [zipped[i] for i in range(10 ** 6, 10 ** 6 + 10)]
+
+    cycled = iterz.ncycle([1, 2, 4, 8], 3, view=True)
+    assert cycled.period == 4
+    assert [list(chunk) for chunk in cycled[1:].chunks(5)] == [
+        [2, 4, 8, 1, 2], [4, 8, 1, 2, 4], [8]]
+    with pytest.raises(ValueError):
+        list(cycled.chunks(0))
+
+    primes = (1009, 1013, 1019, 1021, 1031, 1033, 1039)
+    zipped = iterz.zip_syzygy(*[range(p) for p in primes], view=True)
+    assert zipped.period > 2 ** 63
+    assert repr(zipped) == 'CyclicView(length={})'.format(zipped.period)
+    zipped_iter = iter(zipped)
+    assert [zipped_iter.__next__() for _ in range(3)] == list(zipped[:3])
+    assert next(iter(zipped[10 ** 20:])) == zipped[10 ** 20]
+    chunks = zipped.chunks(10)
+    assert list(chunks.__next__()) == [zipped[i] for i in range(10)]
+    assert chunks.__next__()[0] == zipped[10]
+    chunks = zipped.chunks(2 ** 64)
+    assert [chunks.__next__()[-1] for _ in range(2)] == [
+        zipped[2 ** 64 - 1], zipped[2 ** 65 - 1]]
+
+
+def test_cyclic_iterator():
+    import pickle
+
+    cycled = iterz.inf_cycle([1, 2, 4, 8], seekable=True)
+    assert isinstance(cycled, iterz.CyclicIterator)
+    assert iter(cycled) is cycled
+    assert (cycled.__next__(), cycled.__next__()) == (1, 2)
+    assert cycled.position == 2
+    cycled.advance(10 ** 9)
+    assert cycled.position == 10 ** 9 + 2
+    assert cycled.__next__() == 4
+    cycled.seek(3)
+    assert cycled.__next__() == 8
+    restored = pickle.loads(pickle.dumps(cycled))
+    assert restored.position == 4
+    assert [restored.__next__() for _ in range(5)] == [1, 2, 4, 8, 1]
+    assert cycled.__next__() == 1
+    with pytest.raises(ValueError):
+        cycled.seek(-1)
+    with pytest.raises(TypeError):
+        cycled.advance(1.0)
+
+    a = (1, 2, 3)
+    b = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
+    c = 'abcde'
+    zipped = iterz.zip_inf_cycle(a, b, c, seekable=True)
+    zipped.seek(10 ** 9)
+    assert zipped.__next__() == (a[10 ** 9 % 3], b[10 ** 9 % 7],
+                                 c[10 ** 9 % 5])
+    restored = pickle.loads(pickle.dumps(zipped))
+    assert restored.__next__() == zipped.__next__()
+
+    agen = (x ** 2 for x in range(5))
+    cycled = iterz.inf_cycle(agen, seekable=True)
+    assert cycled.__next__() == 0
+    cycled.seek(3)
+    assert cycled.__next__() == 9
+    cycled.seek(1)
+    assert [cycled.__next__() for _ in range(6)] == [1, 4, 9, 16, 0, 1]
+
+    agen = (x ** 2 for x in range(3))
+    cycled = iterz.inf_cycle(agen, seekable=True)
+    cycled.seek(10)
+    assert cycled.__next__() == 1
+    restored = pickle.loads(pickle.dumps(cycled))
+    assert restored.__next__() == 4
+
+    adict = {'a': 1, 'b': 2}
+    cycled = iterz.inf_cycle(adict, seekable=True)
+    cycled.seek(1)
+    assert [cycled.__next__() for _ in range(3)] == ['b', 'a', 'b']
+    zipped = iterz.zip_inf_cycle([1, 2, 3], adict, seekable=True)
+    zipped.seek(2)
+    assert zipped.__next__() == (3, 'a')
+
+    assert not isinstance(iterz.inf_cycle([1, 2]), iterz.CyclicIterator)
+    assert not isinstance(iterz.zip_inf_cycle([1, 2]), iterz.CyclicIterator)
+    iterz.zip_inf_cycle([1], [])
+    with pytest.raises(IndexError):
+        iterz.zip_inf_cycle([1], [], seekable=True)
+    with pytest.raises(TypeError):
+        iterz.inf_cycle([1, 2], seekable=1)
+
+    zipped = iterz.zip_inf_cycle(seekable=True)
+    zipped.seek(5)
+    assert (zipped.__next__(), zipped.__next__()) == ((), ())
@@ -16,6 +16,9 @@ def test_list_lcm():
     alist = [3]
     assert listutils.list_lcm(alist) == 3
 
+    alist = [2 ** 61 - 1, 2 ** 59]
+    assert listutils.list_lcm(alist) == (2 ** 61 - 1) * 2 ** 59
+
     alist = []
     with pytest.raises(IndexError):
         listutils.list_lcm(alist)
@@ -18,6 +18,9 @@ def test_single_type():
     alist = []
     assert llogic.single_type(alist) == False
 
+    alist = [1, 'a'] + [2] * 1000
+    assert llogic.single_type(alist) == False
+
 
 def test_mixed_type():
     alist = [3, 4, 1, 5, 2]
@@ -35,6 +38,9 @@ def test_mixed_type():
     alist = []
     assert llogic.mixed_type(alist) == False
 
+    alist = [1, 'a'] + [2] * 1000
+    assert llogic.mixed_type(alist) == True
+
 
 def test_intersection():
     alist = [1, 2, 3, 4, 5]
@@ -187,3 +193,23 @@ def test_is_descending():
     step = 2
     with pytest.raises(ValueError):
         llogic.is_descending(alist, step)
+
+
+def test_type_numpy():
+    numpy = pytest.importorskip('numpy')
+
+    array = numpy.array([1, 2, 3])
+    assert llogic.single_type(array) == True
+    assert llogic.mixed_type(array) == False
+
+    array = numpy.array([[1, 2], [3, 4]])
+    assert llogic.single_type(array) == True
+    assert llogic.mixed_type(array) == False
+
+    array = numpy.array([1, 'a', None], dtype=object)
+    assert llogic.single_type(array) == False
+    assert llogic.mixed_type(array) == True
+
+    array = numpy.array([])
+    assert llogic.single_type(array) == False
+    assert llogic.mixed_type(array) == False